@@ -45,7 +45,7 @@ class FundingInfoExtractor:
 
     def extract_funding_articles(self, html_content, company_name):
         """Extract funding-related articles from PR TIMES search results"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         articles = []
 
         # Look for articles that contain funding-related keywords
@@ -108,7 +108,7 @@ class FundingInfoExtractor:
         if not html_content:
             return ""
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
 
         # Remove script and style elements
         for script in soup(["script", "style"]):
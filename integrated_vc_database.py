@@ -1,12 +1,16 @@
+import argparse
 import json
 import csv
+import os
 import pandas as pd
 import logging
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import time
 import re
+from collections import defaultdict
 from urllib.parse import urljoin, urlparse
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -16,6 +20,21 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Parquet support (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Column order of the flattened CSV output (one row per funding article)
+CSV_FIELDNAMES = [
+    'vc_name', 'vc_url', 'company_name', 'initial_investment', 'category', 'website',
+    'description', 'total_funding_articles',
+    'funding_article_number', 'article_title', 'article_url', 'funding_amount'
+]
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -24,6 +43,7 @@ class VCPortfolioWithFunding:
     def __init__(self, headless=True, timeout=10):
         self.vc_list = []
         self.integrated_data = []
+        self._integrated_by_vc = {}
         self.final_output = []
         self.headless = headless
         self.timeout = timeout
@@ -32,6 +52,10 @@ class VCPortfolioWithFunding:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Keep a larger pool of warm keep-alive connections (Prtimes fan-out hits the same host repeatedly)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
         # Portfolio keywords for finding portfolio pages
         self.portfolio_keywords = [
@@ -40,6 +64,8 @@ class VCPortfolioWithFunding:
             'investment', 'invest', '出資先', '投資企業', '投資実績',
             'portfolio companies', 'portfolio companies', '投資対象企業'
         ]
+        # Deduplicated, shortest-first tuple used for the per-link substring checks
+        self._portfolio_keyword_tuple = tuple(sorted(set(self.portfolio_keywords), key=len))
 
         # Initialize Selenium driver
         self._initialize_driver()
@@ -57,10 +83,15 @@ class VCPortfolioWithFunding:
             chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
             chrome_options.add_argument('--disable-extensions')
             chrome_options.add_argument('--disable-plugins')
-            chrome_options.add_argument('--disable-images')
-            chrome_options.add_argument('--disable-javascript')
             chrome_options.add_argument('--disable-web-security')
             chrome_options.add_argument('--allow-running-insecure-content')
+            # Block images, stylesheets and notifications via content settings to cut page weight
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'permissions.default.stylesheet': 2,
+                'profile.default_content_setting_values.notifications': 2
+            })
+            chrome_options.page_load_strategy = 'eager'
 
             try:
                 service = Service(ChromeDriverManager().install())
@@ -179,38 +210,52 @@ class VCPortfolioWithFunding:
             return False
 
     def load_integrated_data(self, json_file='integrated_vc_database.json'):
-        """Load existing integrated data"""
+        """Load existing integrated data (JSON, or Parquet when given a .parquet file)"""
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                self.integrated_data = json.load(f)
+            if json_file.endswith('.parquet'):
+                if not PARQUET_AVAILABLE:
+                    logger.error("pyarrow is required to read Parquet files. Install with: pip install pyarrow")
+                    return False
+                self.integrated_data = pq.read_table(json_file).to_pylist()
+            else:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    self.integrated_data = json.load(f)
+            self._index_integrated_data()
             logger.info(f"Loaded {len(self.integrated_data)} integrated company records")
             return True
         except FileNotFoundError:
             logger.warning(f"Integrated data file {json_file} not found. Starting with empty data.")
             self.integrated_data = []
+            self._index_integrated_data()
             return True
         except Exception as e:
             logger.error(f"Error loading integrated data: {e}")
             return False
 
+    def _index_integrated_data(self):
+        """Group integrated records by VC name for constant-time lookup"""
+        by_vc = defaultdict(list)
+        for item in self.integrated_data:
+            by_vc[item['vc_name']].append(item)
+        self._integrated_by_vc = dict(by_vc)
+
     def find_portfolio_tab(self, soup, base_url):
         """Find portfolio tab in the page"""
+        keywords = self._portfolio_keyword_tuple
         for link in soup.find_all('a', href=True):
-            href = link.get('href', '').lower()
+            href = link['href'].lower()
             text = link.get_text().lower()
 
-            for keyword in self.portfolio_keywords:
-                if keyword in href or keyword in text:
-                    portfolio_url = urljoin(base_url, link['href'])
-                    logger.info(f"Found portfolio tab: {portfolio_url}")
-                    return portfolio_url
+            if any(keyword in href or keyword in text for keyword in keywords):
+                portfolio_url = urljoin(base_url, link['href'])
+                logger.info(f"Found portfolio tab: {portfolio_url}")
+                return portfolio_url
 
         # Check if current page is portfolio page
         current_url = base_url.lower()
-        for keyword in self.portfolio_keywords:
-            if keyword in current_url:
-                logger.info(f"Current page is portfolio page: {base_url}")
-                return base_url
+        if any(keyword in current_url for keyword in keywords):
+            logger.info(f"Current page is portfolio page: {base_url}")
+            return base_url
 
         return None
 
@@ -289,7 +334,8 @@ class VCPortfolioWithFunding:
         try:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            response.encoding = response.apparent_encoding
+            # Raw bytes go to BeautifulSoup, which sniffs the charset from the markup;
+            # apparent_encoding would run a full-body detection pass for nothing
             return BeautifulSoup(response.content, 'lxml')
         except Exception as e:
             logger.error(f"Failed to get HTML with requests: {url} - {e}")
@@ -361,7 +407,7 @@ class VCPortfolioWithFunding:
             response = self.session.get(search_url, timeout=10)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 articles = []
 
                 # Extract articles
@@ -431,7 +477,7 @@ class VCPortfolioWithFunding:
             logger.info(f"Processing VC: {vc_name}")
 
             # Check if we already have data for this VC
-            existing_companies = [item for item in self.integrated_data if item['vc_name'] == vc_name]
+            existing_companies = self._integrated_by_vc.get(vc_name, [])
 
             if existing_companies:
                 logger.info(f"Found {len(existing_companies)} existing companies for {vc_name}")
@@ -477,56 +523,78 @@ class VCPortfolioWithFunding:
         except Exception as e:
             logger.error(f"Error saving to JSON: {e}")
 
+    def save_to_parquet(self, filename='vc_portfolio_comprehensive.parquet'):
+        """Save results to a zstd-compressed Parquet file (much faster to reload than JSON)"""
+        if not PARQUET_AVAILABLE:
+            logger.warning("pyarrow not available. Skipping Parquet output. Install with: pip install pyarrow")
+            return
+        try:
+            pq.write_table(pa.Table.from_pylist(self.final_output), filename, compression='zstd')
+            logger.info(f"Results saved to {filename}")
+        except Exception as e:
+            logger.error(f"Error saving to Parquet: {e}")
+
     def save_to_csv(self, filename='vc_portfolio_comprehensive.csv'):
         """Save results to CSV file"""
         try:
-            # Flatten the data for CSV
-            csv_data = []
-            for item in self.final_output:
-                base_row = {
-                    'vc_name': item['vc_name'],
-                    'vc_url': item['vc_url'],
-                    'company_name': item['company_name'],
-                    'initial_investment': item['initial_investment'],
-                    'category': item['category'],
-                    'website': item['website'],
-                    'description': item['description'],
-                    'total_funding_articles': item['total_funding_articles']
-                }
-
-                # Add funding articles
-                funding_articles = item.get('funding_articles', [])
-                if funding_articles:
-                    for i, article in enumerate(funding_articles):
-                        row = base_row.copy()
-                        row['funding_article_number'] = i + 1
-                        row['article_title'] = article.get('article_title', '')
-                        row['article_url'] = article.get('article_url', '')
-                        row['funding_amount'] = article.get('funding_amount', '')
-                        csv_data.append(row)
-                else:
-                    base_row['funding_article_number'] = ''
-                    base_row['article_title'] = ''
-                    base_row['article_url'] = ''
-                    base_row['funding_amount'] = ''
-                    csv_data.append(base_row)
-
-            df = pd.DataFrame(csv_data)
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
+            # Write rows as they are flattened instead of building a DataFrame first
+            with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES, lineterminator=os.linesep)
+                writer.writeheader()
+                writer.writerows(self._iter_csv_rows())
             logger.info(f"Results saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving to CSV: {e}")
 
+    def _iter_csv_rows(self):
+        """Yield one flat CSV row per funding article (or one row for companies without articles)"""
+        for item in self.final_output:
+            base_row = {
+                'vc_name': item['vc_name'],
+                'vc_url': item['vc_url'],
+                'company_name': item['company_name'],
+                'initial_investment': item['initial_investment'],
+                'category': item['category'],
+                'website': item['website'],
+                'description': item['description'],
+                'total_funding_articles': item['total_funding_articles']
+            }
+
+            # Add funding articles
+            funding_articles = item.get('funding_articles', [])
+            if funding_articles:
+                for i, article in enumerate(funding_articles):
+                    row = base_row.copy()
+                    row['funding_article_number'] = i + 1
+                    row['article_title'] = article.get('article_title', '')
+                    row['article_url'] = article.get('article_url', '')
+                    row['funding_amount'] = article.get('funding_amount', '')
+                    yield row
+            else:
+                base_row['funding_article_number'] = ''
+                base_row['article_title'] = ''
+                base_row['article_url'] = ''
+                base_row['funding_amount'] = ''
+                yield base_row
+
     def create_summary_report(self):
         """Create summary report"""
         total_companies = len(self.final_output)
-        vcs_with_companies = len(set(item['vc_name'] for item in self.final_output))
-        companies_with_funding = len([item for item in self.final_output if item['total_funding_articles'] > 0])
-        total_funding_articles = sum(item['total_funding_articles'] for item in self.final_output)
+        vc_names = set()
+        companies_with_funding = 0
+        total_funding_articles = 0
+
+        # Single pass over the output instead of one scan per statistic
+        for item in self.final_output:
+            vc_names.add(item['vc_name'])
+            article_count = item['total_funding_articles']
+            total_funding_articles += article_count
+            if article_count > 0:
+                companies_with_funding += 1
 
         summary = {
             'total_companies': total_companies,
-            'vcs_with_companies': vcs_with_companies,
+            'vcs_with_companies': len(vc_names),
             'companies_with_funding_info': companies_with_funding,
             'total_funding_articles': total_funding_articles,
             'vcs_processed': len(self.vc_list)
@@ -550,6 +618,11 @@ class VCPortfolioWithFunding:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description='Create the comprehensive VC portfolio database')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Also write vc_portfolio_comprehensive.parquet (requires pyarrow)')
+    args = parser.parse_args()
+
     vc_portfolio = VCPortfolioWithFunding(headless=True, timeout=20)
 
     try:
@@ -566,6 +639,8 @@ def main():
 
         # Save results
         vc_portfolio.save_to_json()
+        if args.parquet:
+            vc_portfolio.save_to_parquet()
         vc_portfolio.save_to_csv()
 
         # Create summary
@@ -6,44 +6,66 @@ URLリストからHTML構成要素を集め、portfolioタブを見つけ、そ
 画像ベースの会社名にも対応し、OCR機能も含む
 """
 
+from __future__ import annotations
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import json
 import csv
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml.etree import ParserError
+import soupsieve as sv
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
 import re
-from typing import List, Dict, Optional, Set, Tuple
+from typing import TYPE_CHECKING, List, Dict, Optional, Set, Tuple
+import importlib.util
 import logging
 import os
-from PIL import Image
+import contextlib
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import io
-import base64
-import cv2
-import numpy as np
+import queue
 
-# OCR関連のインポート
-try:
-    import easyocr
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
+# 画像処理・OCR・pandasは読み込みが重い（easyocrはtorchを読み込む）ため、
+# 使用する処理の中で遅延インポートする。ここでは有無だけを確認する
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
+OCR_AVAILABLE = importlib.util.find_spec('easyocr') is not None
+if not OCR_AVAILABLE:
     print("Warning: easyocr not available. Install with: pip install easyocr")
 
+TESSERACT_AVAILABLE = importlib.util.find_spec('pytesseract') is not None
+if not TESSERACT_AVAILABLE:
+    print("Warning: pytesseract not available. Install with: pip install pytesseract")
+
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec('playwright') is not None
+
+# brotliがあればurllib3がbr圧縮の応答を展開できるので、Accept-Encodingに含める
+BROTLI_AVAILABLE = any(importlib.util.find_spec(name) is not None for name in ('brotli', 'brotlicffi'))
+
+# 線形時間の正規表現エンジン（オプション）
 try:
-    import pytesseract
-    TESSERACT_AVAILABLE = True
+    import re2
+    RE2_AVAILABLE = True
 except ImportError:
-    TESSERACT_AVAILABLE = False
-    print("Warning: pytesseract not available. Install with: pip install pytesseract")
+    RE2_AVAILABLE = False
 
 # ログ設定
 logging.basicConfig(
@@ -56,8 +78,797 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 事前コンパイル済みの正規表現（呼び出しごとの再コンパイルを避ける）
+# 国旗絵文字（地域指示記号）の削除テーブル。国旗は2つの記号の組なので記号単位で削除する
+_FLAG_TRANS = str.maketrans('', '', '🇯🇵🇺🇸🇳🇱🇨🇦🇬🇧')
+_KEEP_RE = re.compile(r'[^\w\s\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]')
+# ファイル名から除去する文字（数字と記号）
+_FILENAME_STRIP_RE = re.compile(r'[0-9]|[^\w\s]')
+# ファイル名の区切り文字をスペースに変換するテーブル
+_FILENAME_SEP_TRANS = str.maketrans('_-+', '   ')
+
+# OCR結果の後処理で除外するパターン
+POSTPROCESS_EXCLUDE_PATTERNS = [
+    r'^[0-9]+$',  # 数字のみ
+    r'^[a-zA-Z]{1,2}$',  # 1-2文字のアルファベット
+    r'^(click|read|more|view|learn|see|home|about|contact)$',  # 一般的なナビゲーション用語
+    r'^(logo|image|photo|picture|icon)$',  # 画像関連用語
+]
+
+
+def _fuse_patterns(patterns: List[str], flags: int = 0) -> re.Pattern:
+    """パターンのリストを1つの選択パターンにまとめ、1回のmatchでいずれかに一致するか判定できるようにする"""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+
+_POSTPROCESS_EXCLUDE_RE = _fuse_patterns(POSTPROCESS_EXCLUDE_PATTERNS)
+
+# 会社名フィルタリングで除外すべきパターン
+EXCLUDE_PATTERNS = [
+    # 一般的なナビゲーション要素
+    r'^(top|home|about|contact|news|blog|careers|privacy|terms|login|signup|search)$',
+    r'^(menu|navigation|header|footer|sidebar|main|content)$',
+    r'^(next|previous|back|forward|close|open|expand|collapse)$',
+
+    # 一般的な単語
+    r'^(our|we|you|they|them|this|that|these|those)$',
+    r'^(the|and|or|but|for|with|from|to|in|on|at|by)$',
+    r'^(all|any|some|many|few|much|little|more|less)$',
+
+    # 技術的なノイズ
+    r'^[a-f0-9]{8,}$',  # 16進数文字列
+    r'^[a-z]{1,2}$',  # 1-2文字のアルファベット
+    r'^[0-9]+$',  # 数字のみ
+    r'^[a-z]+[0-9]+[a-z]+$',  # アルファベット+数字+アルファベット
+
+    # OCRノイズ
+    r'^[a-z]{3,}[a-z]{3,}[a-z]{3,}$',  # 繰り返し文字
+    r'^[a-z]+[a-z]+[a-z]+[a-z]+$',  # 4回以上の繰り返し
+
+    # 画像・ファイル関連
+    r'\.(png|jpg|jpeg|gif|svg|ico|webp)$',
+    r'^(logo|image|photo|picture|icon|img)$',
+    r'^(download|upload|file|document|pdf)$',
+    r'.*logo.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # ロゴファイル
+    r'.*_logo.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _logoを含むファイル
+    r'.*logo_.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # logo_を含むファイル
+    r'.*_edited.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _editedを含むファイル
+    r'.*_2025.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _2025を含むファイル
+    r'.*_2024.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _2024を含むファイル
+    r'.*_2023.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _2023を含むファイル
+
+    # 言語・地域関連
+    r'^(en|jp|ja|us|uk|eu|asia|pacific|global|world)$',
+    r'^(english|japanese|chinese|korean|spanish|french|german)$',
+
+    # 日付・時刻
+    r'^\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
+    r'^\d{2}:\d{2}:\d{2}',  # HH:MM:SS
+    r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',  # ISO形式
+
+    # 特殊文字のみ
+    r'^[^\w\s]+$',
+
+    # 短すぎるテキスト
+    r'^.{1,2}$',
+
+    # 長すぎるテキスト（説明文など）
+    r'^.{100,}$',
+]
+_EXCLUDE_RE = _fuse_patterns(EXCLUDE_PATTERNS)
+
+# 会社名らしいパターン
+COMPANY_NAME_PATTERNS = [
+    r'.*株式会社.*',
+    r'.*有限会社.*',
+    r'.*合同会社.*',
+    r'.*Inc\.?$',
+    r'.*Corp\.?$',
+    r'.*LLC$',
+    r'.*Ltd\.?$',
+    r'.*Co\.?$',
+    r'.*Company$',
+    r'.*Technologies$',
+    r'.*Systems$',
+    r'.*Solutions$',
+    r'.*Group$',
+    r'.*Partners$',
+    r'.*Ventures$',
+    r'.*Capital$',
+    r'.*Fund$',
+    r'.*Studio$',
+    r'.*Labs$',
+    r'.*Works$',
+    r'.*Services$',
+    r'.*Platform$',
+    r'.*Network$',
+    r'.*Media$',
+    r'.*Digital$',
+    r'.*Tech$',
+    r'.*AI$',
+    r'.*Bio$',
+    r'.*Health$',
+    r'.*Care$',
+    r'.*Life$',
+    r'.*Food$',
+    r'.*Energy$',
+    r'.*Green$',
+    r'.*Eco$',
+    r'.*Smart$',
+    r'.*Next$',
+    r'.*Future$',
+    r'.*Global$',
+    r'.*World$',
+    r'.*International$',
+    r'.*Japan$',
+    r'.*Asia$',
+    r'.*Pacific$',
+    r'.*America$',
+    r'.*Europe$',
+]
+_COMPANY_NAME_RE = _fuse_patterns(COMPANY_NAME_PATTERNS, re.IGNORECASE)
+
+# ページ本文から会社名を拾うための法人格・接尾辞（1回の走査で全パターンを照合する）
+COMPANY_SUFFIXES_JP = ['株式会社', '有限会社', '合同会社']
+COMPANY_SUFFIXES_EN = [
+    'Inc.', 'Corp.', 'LLC', 'Ltd.', 'Co.', 'Company', 'Technologies', 'Systems',
+    'Solutions', 'Group', 'Partners', 'Ventures', 'Capital', 'Fund', 'Studio',
+    'Labs', 'Works', 'Services', 'Platform', 'Network', 'Media', 'Digital',
+    'Tech', 'AI', 'Bio', 'Health', 'Care', 'Life', 'Food', 'Energy', 'Green',
+    'Eco', 'Smart', 'Next', 'Future', 'Global', 'World', 'International',
+    'Japan', 'Asia', 'Pacific', 'America', 'Europe',
+]
+
+
+def _compile_linear(pattern: str):
+    """re2が使えればDFAベースの線形時間エンジンで、使えなければ標準のreでコンパイルする"""
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except Exception as e:
+            logger.debug(f"re2でのコンパイルに失敗したためreを使用: {e}")
+    return re.compile(pattern)
+
+
+def _keyword_regex(keywords) -> re.Pattern:
+    """キーワードのいずれかを含むかを1回の走査で判定する正規表現を作る"""
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+
+
+def _suffix_alternation(suffixes: List[str]) -> str:
+    """長い接尾辞を優先するようにエスケープ済みの選択肢を作る"""
+    return '|'.join(re.escape(s) for s in sorted(suffixes, key=len, reverse=True))
+
+
+# 空白文字（標準のreの\sと同じ集合）。re2の\sはASCIIの空白だけに一致し、全角空白や
+# get_text()が&nbsp;から作る\xa0を単語の一部とみなすため、どちらのエンジンでも同じ結果になるよう明示する
+_WHITESPACE_CHARS = '\t\n\v\f\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+_WS = f'[{_WHITESPACE_CHARS}]'
+_NON_WS = f'[^{_WHITESPACE_CHARS}]'
+
+_SUFFIXES_JP = _suffix_alternation(COMPANY_SUFFIXES_JP)
+COMPANY_RE_JP = _compile_linear(
+    rf'(?:{_SUFFIXES_JP}){_WS}*({_NON_WS}+)|({_NON_WS}+){_WS}*(?:{_SUFFIXES_JP}|㈱|㈲|㈳)'
+)
+COMPANY_RE_EN = _compile_linear(rf'({_NON_WS}+){_WS}*(?:{_suffix_alternation(COMPANY_SUFFIXES_EN)})')
+
+# 会社名らしさを判定するキーワード（小文字化したテキストに対して部分一致で使う）
+COMPANY_HINT_KEYWORDS = frozenset(['inc', 'corp', 'ltd', 'co', '株式会社', '有限会社', '合同会社'])
+LOGO_HINT_KEYWORDS = frozenset(['logo', 'company', 'corp', 'inc', 'ltd', '株式会社', '有限会社'])
+_COMPANY_HINT_RE = _keyword_regex(COMPANY_HINT_KEYWORDS)
+_LOGO_HINT_RE = _keyword_regex(LOGO_HINT_KEYWORDS)
+
+
+# 会社名を含む要素のCSSセレクタ
+# soupsieveでセレクタリストとして事前コンパイルし、1回の走査で全セレクタを照合する
+PORTFOLIO_SELECTORS = [
+    '.fg-item-title',  # 15th Rock
+    '.card_companyName__BWs6G',  # ANRI
+    '.portfolioItem__title',  # サムライインキュベート
+    '.portfolio__item',  # ジェネシア
+    '[class*="company-name"]',
+    '[class*="companyName"]',
+    '[class*="fg-item-title"]',
+    '[class*="card_companyName"]',
+    '[class*="portfolio-item"]',
+    '[class*="portfolioItem"]',
+    'h2.fg-item-title',
+    'h3.card_companyName__BWs6G',
+    '.portfolio-item h2',
+    '.portfolio-item h3',
+    '.company-card h2',
+    '.company-card h3',
+    '.card h2',
+    '.card h3',
+    '.gallery-item h2',
+    '.gallery-item h3',
+    '.portfolio__item h3',
+    '.portfolio__item h2'
+]
+PORTFOLIO_SELECTOR = ', '.join(PORTFOLIO_SELECTORS)
+_PORTFOLIO_SELECTOR_SV = sv.compile(PORTFOLIO_SELECTOR)
+
+LINK_SELECTORS = [
+    'a[href*="http"]',  # 外部リンク
+    '.card a',
+    '.portfolio-item a',
+    '.company-card a',
+    '.gallery-item a',
+    '.portfolio__item a'
+]
+_LINK_SELECTOR_SV = sv.compile(', '.join(LINK_SELECTORS))
+
+# 会社名のキーワードを含む場合に候補とする見出し・リスト項目
+HEADING_AND_LIST_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li']
+
+# OCR対象としてダウンロードする画像の最大サイズ（バイト）
+MAX_IMAGE_BYTES = 5_000_000
+
+# ポートフォリオタブを探すときに解析する要素（ページ全体の解析を避ける）
+PORTFOLIO_TAB_STRAINER = SoupStrainer(['a', 'meta'])
+
+# 詳細ページの読み込み完了とみなす要素
+DETAIL_READY_SELECTOR = 'h1, h2, .company-name, main'
+_DETAIL_READY_SV = sv.compile(DETAIL_READY_SELECTOR)
+
+# Seleniumで読み込みを遮断するURLパターン（広告・トラッカー・Webフォント・動画）
+BLOCKED_URL_PATTERNS = [
+    '*googletagmanager.com*',
+    '*google-analytics.com*',
+    '*doubleclick.net*',
+    '*facebook.net*',
+    '*hotjar.com*',
+    '*.woff', '*.woff2', '*.ttf',
+    '*.mp4', '*.webm',
+]
+
+
+# 明らかなUI要素・役職・業界用語（完全一致で除外し、会社名らしくない候補では部分一致でも除外する）
+OBVIOUS_UI_ELEMENTS = frozenset([
+    'website', 'location', 'chevron', 'right', 'left', 'up', 'down',
+    'general', 'partner', 'lead', 'position', 'principal', 'associate',
+    'founder', 'ceo', 'cto', 'cfo', 'coo', 'director', 'manager',
+    'team', 'member', 'staff', 'employee', 'consultant', 'advisor',
+    'board', 'committee', 'council', 'group', 'division', 'department',
+    'section', 'unit', 'branch', 'office', 'address',
+    'phone', 'email', 'contact', 'support', 'help', 'info', 'information',
+    'service', 'services', 'product', 'products', 'solution', 'solutions',
+    'technology', 'technologies', 'innovation', 'research', 'development',
+    'investment', 'investments', 'portfolio', 'portfolios', 'company', 'companies',
+    'corporation', 'corporations', 'limited', 'incorporated', 'partnership',
+    'venture', 'ventures', 'capital', 'fund', 'funds', 'asset', 'assets',
+    'management', 'consulting', 'advisory', 'financial', 'banking',
+    'insurance', 'real estate', 'property', 'construction',
+    'manufacturing', 'production', 'distribution', 'retail', 'wholesale',
+    'trade', 'commerce', 'business', 'enterprise', 'startup', 'startups',
+    'scaleup', 'scaleups', 'growth', 'expansion', 'acquisition', 'merger',
+    'exit', 'exits', 'ipo', 'm&a', 'ma', 'deal', 'deals', 'transaction',
+    'round', 'series', 'seed', 'angel', 'pre-seed'
+])
+
+# 会社名フィルタリングで除外するキーワード（厳しさを調整）
+# 3文字未満の候補は長さチェックで先に除外されるため、単一文字はここに含めない
+EXCLUDE_KEYWORDS = frozenset({
+    'copyright', 'privacy', 'terms', 'policy', 'legal', 'disclaimer',
+    'top', 'home', 'about', 'contact', 'news', 'blog', 'careers',
+    'menu', 'navigation', 'header', 'footer', 'sidebar',
+    'next', 'previous', 'back', 'forward', 'close', 'open',
+    'our', 'we', 'you', 'they', 'them', 'this', 'that',
+    'logo', 'image', 'photo', 'picture', 'icon', 'img',
+    'download', 'upload', 'file', 'document',
+    'en', 'jp', 'ja', 'us', 'uk', 'eu', 'asia', 'pacific',
+    'english', 'japanese', 'chinese', 'korean',
+    'all', 'any', 'some', 'many', 'few', 'much', 'little',
+    'the', 'and', 'or', 'but', 'for', 'with', 'from', 'to', 'in', 'on', 'at', 'by',
+}) | OBVIOUS_UI_ELEMENTS
+
+# CSV・Parquetに出力する列
+RESULT_FIELDNAMES = ['url', 'portfolio_url', 'company_name', 'method', 'ocr_used', 'error']
+
+# プロセスプールでフィルタリングする際に1プロセスへ渡す候補数
+FILTER_CHUNK_SIZE = 1000
+
+# この件数以上の候補はpandasでまとめてフィルタリングする（少数では変換のオーバーヘッドが上回る）
+VECTORIZE_MIN_CANDIDATES = 2000
+
+# 全UI要素を1回の走査で照合する（re2があれば線形時間のDFAで実行）
+_UI_ELEMENT_RE = _compile_linear(_suffix_alternation(list(OBVIOUS_UI_ELEMENTS)))
+
+
+def _looks_like_company_name(company: str, company_lower: str) -> bool:
+    """
+    会社名パターンに一致しなかった候補を長さと文字種で判定する
+
+    Args:
+        company: 候補のテキスト
+        company_lower: 小文字化・前後の空白除去済みのテキスト
+
+    Returns:
+        会社名らしい場合はTrue
+    """
+    # 3-20文字で、大文字小文字が混在している場合は会社名の可能性
+    if 3 <= len(company) <= 20 and _has_mixed_case(company):
+        # 追加チェック: 明らかなUI要素でないことを確認（厳しさを調整）
+        return not _UI_ELEMENT_RE.search(company_lower)
+
+    # 追加: 日本語の会社名パターン
+    return (3 <= len(company) <= 30 and
+            not company.isascii())  # 非ASCII文字（日本語など）を含む
+
+
+def _has_mixed_case(text: str) -> bool:
+    """大文字と小文字の両方を含むかを1回の走査で判定する（両方見つかった時点で終了）"""
+    # すべて小文字・すべて大文字の文字列はC実装の判定だけで除外し、Pythonのループを回さない
+    if text.islower() or text.isupper():
+        return False
+    has_upper = has_lower = False
+    for c in text:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        else:
+            continue
+        if has_upper and has_lower:
+            return True
+    return False
+
+
+def _filter_company_names_vectorized(companies: Set[str]) -> Set[str]:
+    """
+    filter_company_namesと同じ判定をpandasの文字列演算でまとめて行う（候補が多い場合用）
+
+    長さ・除外キーワード・除外パターン・会社名パターンは列単位で判定し、
+    会社名パターンに一致しなかった残りだけを1件ずつ判定する。
+    """
+    import pandas as pd
+
+    candidates = pd.Series(list(companies), dtype=object)
+    lower = candidates.str.lower().str.strip()
+
+    keep = (lower.str.len().between(3, 50)
+            & ~lower.isin(EXCLUDE_KEYWORDS)
+            & ~lower.str.match(_EXCLUDE_RE).astype(bool))
+    candidates = candidates[keep]
+    lower = lower[keep]
+
+    is_company_like = candidates.str.match(_COMPANY_NAME_RE).astype(bool)
+    filtered_companies = set(candidates[is_company_like])
+    filtered_companies.update(
+        company for company, company_lower in zip(candidates[~is_company_like], lower[~is_company_like])
+        if _looks_like_company_name(company, company_lower)
+    )
+    return filtered_companies
+
+
+def filter_company_names(companies: Set[str]) -> Set[str]:
+    """
+    会社名の候補からノイズを除去する
+
+    インスタンスに依存しない関数として、キーワード表などの定数はモジュールレベルで1回だけ構築する。
+
+    Args:
+        companies: 抽出された会社名のセット
+
+    Returns:
+        フィルタリングされた会社名のセット
+    """
+    # 候補が多い場合は列単位の演算でまとめて判定する
+    if len(companies) >= VECTORIZE_MIN_CANDIDATES:
+        try:
+            return _filter_company_names_vectorized(companies)
+        except ImportError:
+            pass
+
+    # 正規化は1回だけ行い、以降は段階ごとの内包表記で候補を絞り込む
+    lowered = {company: company.lower().strip() for company in companies}
+
+    # 基本的な長さチェックと除外キーワードチェック
+    lowered = {company: company_lower for company, company_lower in lowered.items()
+               if 3 <= len(company_lower) <= 50 and company_lower not in EXCLUDE_KEYWORDS}
+
+    # 除外パターンチェック
+    lowered = {company: company_lower for company, company_lower in lowered.items()
+               if not _EXCLUDE_RE.match(company_lower)}
+
+    # 長さと内容で会社名らしいと判断できるものを先に採用し、残りだけを会社名パターンで判定する
+    # （どちらか一方を満たせば採用なので順序は結果に影響しない。パターンは約60個の「.*接尾辞$」の
+    # 選択で候補1件あたりのコストが最も大きいため、文字種の判定で決まらなかった候補だけに適用する）
+    filtered_companies = {company for company, company_lower in lowered.items()
+                          if _looks_like_company_name(company, company_lower)}
+    filtered_companies.update(filter(_COMPANY_NAME_RE.match, lowered.keys() - filtered_companies))
+    return filtered_companies
+
+
+# EasyOCRのReaderはモデルの読み込みに数秒かかるため、プロセス内で1つを共有する
+_EASYOCR_READERS = {}
+_EASYOCR_LOCK = threading.Lock()
+
+
+def _get_ocr_reader(gpu: bool = False):
+    """初期化済みのEasyOCR Readerを返す（初回呼び出し時のみ生成）"""
+    with _EASYOCR_LOCK:
+        reader = _EASYOCR_READERS.get(gpu)
+        if reader is None:
+            import easyocr
+            reader = easyocr.Reader(['ja', 'en'], gpu=gpu)
+            _EASYOCR_READERS[gpu] = reader
+        return reader
+
+
+class OCRCache:
+    """
+    画像内容のハッシュをキーにしたOCR結果のディスクキャッシュ（SQLite）
+
+    ポートフォリオサイトでは同じロゴが複数ページで使い回されるため、
+    一度OCRした画像は再計算せずに結果を返す。上限件数を超えた場合は
+    最終参照時刻の古いものから削除する（LRU）。
+    """
+
+    def __init__(self, path: str = '.ocr_cache.sqlite3', max_entries: int = 100000,
+                 negative_ttl: int = 24 * 60 * 60):
+        """
+        Args:
+            path: キャッシュファイルのパス
+            max_entries: 保持する最大件数
+            negative_ttl: テキストが得られなかった結果を保持する秒数
+        """
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS ocr_cache ('
+            'key TEXT PRIMARY KEY, text TEXT, created REAL, accessed REAL)'
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(image_bytes: bytes) -> str:
+        """画像データからキャッシュキーを作成"""
+        return hashlib.sha1(image_bytes).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, Optional[str]]:
+        """
+        キャッシュを参照
+
+        Returns:
+            (ヒットしたかどうか, キャッシュされたテキスト)
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT text, created FROM ocr_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+
+            text, created = row
+            # 失敗結果は短い期間だけ保持する
+            if text is None and now - created > self.negative_ttl:
+                self._conn.execute('DELETE FROM ocr_cache WHERE key = ?', (key,))
+                self._conn.commit()
+                return False, None
+
+            self._conn.execute('UPDATE ocr_cache SET accessed = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+            return True, text
+
+    def set(self, key: str, text: Optional[str]):
+        """OCR結果を保存（Noneは失敗結果として保存）"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO ocr_cache (key, text, created, accessed) VALUES (?, ?, ?, ?)',
+                (key, text, now, now)
+            )
+            # 上限を超えた分を最終参照の古い順に削除
+            self._conn.execute(
+                'DELETE FROM ocr_cache WHERE key IN ('
+                'SELECT key FROM ocr_cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def close(self):
+        """キャッシュを閉じる"""
+        with self._lock:
+            self._conn.close()
+
+
+class PageResultCache:
+    """
+    ページHTMLの内容ハッシュをキーにした会社名抽出結果のディスクキャッシュ（SQLite）
+
+    再実行時やミラーサイトなど、同じ内容のページは解析・OCRをやり直さずに結果を返す。
+    結果は取得時点の詳細ページや画像にも依存するので、有効期限を過ぎたものは使わない。
+    """
+
+    def __init__(self, path: str = '.page_cache.sqlite3', ttl: float = 7 * 86400):
+        """
+        Args:
+            path: キャッシュファイルのパス
+            ttl: 保存した結果を使う期間（秒）
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS page_cache ('
+            'key TEXT PRIMARY KEY, companies TEXT, created REAL)'
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(html: bytes, page_url: str, use_ocr: bool) -> str:
+        """HTMLの内容とページURL・OCR設定からキャッシュキーを作成"""
+        digest = hashlib.sha256(html)
+        digest.update(f'\0{page_url}\0{int(use_ocr)}'.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """キャッシュされた会社名のリストを返す（なければ、または有効期限切れならNone）"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT companies FROM page_cache WHERE key = ? AND created >= ?', (key, time.time() - self.ttl)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, companies: List[str]):
+        """会社名のリストを保存"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO page_cache (key, companies, created) VALUES (?, ?, ?)',
+                (key, json.dumps(companies, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        """キャッシュを閉じる"""
+        with self._lock:
+            self._conn.close()
+
+
+class HttpResponseCache:
+    """
+    URLごとのHTTP応答（本文とETag/Last-Modified）のディスクキャッシュ（SQLite）
+
+    有効期限内のURLは再取得せず、期限切れのURLは条件付きリクエストで変更の有無だけを確認する。
+    """
+
+    def __init__(self, path: str = '.http_cache.sqlite3', ttl: float = 86400):
+        """
+        Args:
+            path: キャッシュファイルのパス
+            ttl: 再検証せずにキャッシュを使う期間（秒）
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS http_cache ('
+            'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, fetched REAL)'
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Tuple[bool, Optional[str], Optional[str], bytes]]:
+        """
+        キャッシュされた応答を返す
+
+        Returns:
+            (有効期限内かどうか, ETag, Last-Modified, 本文)、なければNone
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, last_modified, body, fetched FROM http_cache WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, body, fetched = row
+        return time.time() - fetched < self.ttl, etag, last_modified, body
+
+    def set(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        """応答を保存"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, fetched) VALUES (?, ?, ?, ?, ?)',
+                (url, etag, last_modified, body, time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, url: str):
+        """変更がなかった応答の取得時刻を更新"""
+        with self._lock:
+            self._conn.execute('UPDATE http_cache SET fetched = ? WHERE url = ?', (time.time(), url))
+            self._conn.commit()
+
+    def close(self):
+        """キャッシュを閉じる"""
+        with self._lock:
+            self._conn.close()
+
+
+class PlaywrightRenderer:
+    """
+    Playwright（CDPで直接ブラウザを操作）でJavaScriptが必要なページを描画する
+
+    PlaywrightのブラウザはPlaywrightを起動したスレッドからしか操作できないため、
+    専用のスレッドでブラウザを保持し、各スレッドからの描画要求をそのスレッドで実行する。
+    コンテキストはURL間で共有し、Cookieやキャッシュを使い回す。
+    """
+
+    # 描画に不要な（OCR用の画像はsrcからrequestsで取得する）リソースの種類
+    BLOCKED_RESOURCE_TYPES = frozenset(['image', 'media', 'font'])
+
+    def __init__(self, headless: bool = True, timeout: float = 10, user_agent: Optional[str] = None):
+        """
+        Args:
+            headless: ヘッドレスモードで実行するかどうか
+            timeout: ページ読み込みのタイムアウト（秒）
+            user_agent: ブラウザのUser-Agent
+        """
+        self._timeout_ms = timeout * 1000
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='playwright')
+        self._executor.submit(self._start, headless, user_agent).result()
+
+    def _start(self, headless: bool, user_agent: Optional[str]):
+        from playwright.sync_api import sync_playwright
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(headless=headless)
+        self._context = self._browser.new_context(user_agent=user_agent)
+        self._context.route('**/*', self._route)
+
+    def _route(self, route):
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def render(self, url: str, wait_until: str = 'domcontentloaded', ready_selector: Optional[str] = None,
+               ready_timeout: Optional[float] = None) -> str:
+        """
+        ページを描画してHTMLを返す
+
+        Args:
+            url: ページのURL
+            wait_until: page.gotoで待つイベント（'domcontentloaded' / 'load'）
+            ready_selector: この要素が現れるまで待つ（見つからなければタイムアウト後にそのまま返す）
+            ready_timeout: ready_selectorを待つ時間（秒、省略時はページ読み込みのタイムアウト）
+
+        Returns:
+            描画後のHTML
+        """
+        return self._executor.submit(self._render, url, wait_until, ready_selector, ready_timeout).result()
+
+    def _render(self, url: str, wait_until: str, ready_selector: Optional[str], ready_timeout: Optional[float]) -> str:
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        page = self._context.new_page()
+        try:
+            page.goto(url, wait_until=wait_until, timeout=self._timeout_ms)
+            if ready_selector:
+                timeout_ms = ready_timeout * 1000 if ready_timeout is not None else self._timeout_ms
+                try:
+                    page.wait_for_selector(ready_selector, timeout=timeout_ms)
+                except PlaywrightTimeoutError:
+                    pass
+            return page.content()
+        finally:
+            page.close()
+
+    def _stop(self):
+        self._context.close()
+        self._browser.close()
+        self._playwright.stop()
+
+    def close(self):
+        """ブラウザを終了する"""
+        try:
+            self._executor.submit(self._stop).result()
+        finally:
+            self._executor.shutdown()
+
+
+class ResultCheckpointWriter:
+    """
+    スクレイピング結果をJSON Lines形式のチェックポイントに書き出す専用スレッド
+
+    書き込みはキューを介して1つのスレッドで行い、スクレイピング側はファイルI/Oを待たない。
+    1結果1行で追記するため、途中で異常終了してもそれまでの結果は失われない。
+    """
+
+    def __init__(self, path: str, fsync_every: int = 20):
+        """
+        Args:
+            path: チェックポイントファイルのパス（既存の内容には追記する）
+            fsync_every: この件数ごとにディスクへ同期する
+        """
+        self.path = path
+        self.fsync_every = fsync_every
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._writer_loop, name='checkpoint-writer', daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def load(path: str) -> List[Dict[str, any]]:
+        """チェックポイントから結果を読み込む（ファイルがなければ空、書きかけの最終行は無視する）"""
+        results = []
+        try:
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        results.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning(f"チェックポイントの不完全な行を無視します: {path}")
+        except FileNotFoundError:
+            pass
+        return results
+
+    def put(self, result: Dict[str, any]):
+        """結果を書き込みキューに追加する"""
+        self._queue.put(result)
+
+    def _writer_loop(self):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            # 前回の異常終了で最終行が書きかけの場合は、次の結果がその行に連結されないよう改行する
+            if f.tell() > 0:
+                with open(self.path, 'rb') as existing:
+                    existing.seek(-1, os.SEEK_END)
+                    if existing.read(1) != b'\n':
+                        f.write('\n')
+            pending = 0
+            while True:
+                result = self._queue.get()
+                if result is None:
+                    break
+                f.write(json.dumps(result, ensure_ascii=False) + '\n')
+                f.flush()
+                pending += 1
+                if pending >= self.fsync_every:
+                    os.fsync(f.fileno())
+                    pending = 0
+            os.fsync(f.fileno())
+
+    def close(self):
+        """キューに残った結果を書き終えてからスレッドを終了する"""
+        self._queue.put(None)
+        self._thread.join()
+
+
+class HostRateLimiter:
+    """
+    ホストごとに最小間隔を空けるレートリミッター（スレッドセーフ）
+
+    異なるホストへのアクセスは待たずに進め、同じホストへのアクセスだけを間隔分ずらす。
+    """
+
+    def __init__(self, interval: float = 2.0):
+        """
+        Args:
+            interval: 同じホストへのアクセス間隔（秒）
+        """
+        self.interval = interval
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        """URLのホストにアクセスできる時刻まで待機する"""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            allowed = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = allowed + self.interval
+
+        delay = allowed - now
+        if delay > 0:
+            time.sleep(delay)
+
+
 class PortfolioScraper:
-    def __init__(self, headless=True, timeout=10, use_ocr=False):
+    def __init__(self, headless=True, timeout=10, use_ocr=False, max_workers=16,
+                 ocr_cache_path='.ocr_cache.sqlite3', ocr_batch_size=8, use_gpu_ocr=False,
+                 max_detail_pages=10, max_url_workers=8, page_cache_path='.page_cache.sqlite3',
+                 filter_processes=0, http_cache_path='.http_cache.sqlite3', http_cache_ttl=86400,
+                 browser='selenium', head_check=True, page_cache_ttl=7 * 86400):
         """
         スクレイパーの初期化
 
@@ -65,23 +876,87 @@ class PortfolioScraper:
             headless: ヘッドレスモードで実行するかどうか
             timeout: タイムアウト時間（秒）
             use_ocr: OCR機能を使用するかどうか
+            max_workers: 画像ダウンロードなどのI/Oを並列実行するスレッド数
+            ocr_cache_path: OCR結果キャッシュのパス（Noneでキャッシュ無効）
+            ocr_batch_size: EasyOCRで一度に推論する画像数
+            use_gpu_ocr: CUDAが使える場合にEasyOCRをGPU（FP16）で実行するかどうか
+            max_detail_pages: 画像リンク先の詳細ページを取得する最大数（1ページあたり）
+            max_url_workers: scrape_urlsで同時に処理するURL数
+            page_cache_path: ページ単位の抽出結果キャッシュのパス（Noneでキャッシュ無効）
+            filter_processes: 会社名フィルタリングを実行するプロセス数（0でスレッド内で実行）
+            http_cache_path: ページのHTTP応答キャッシュのパス（Noneでキャッシュ無効）
+            http_cache_ttl: HTTP応答キャッシュを再検証せずに使う期間（秒）
+            browser: JavaScriptが必要なページの描画に使うブラウザ（'selenium' または 'playwright'）
+            head_check: scrape_urlsの前にHEADリクエストで存在しないURL（404/410）を除外するかどうか
+            page_cache_ttl: ページ単位の抽出結果キャッシュを使う期間（秒）
         """
         self.headless = headless
         self.timeout = timeout
         self.use_ocr = use_ocr and (OCR_AVAILABLE or TESSERACT_AVAILABLE)
+        self.max_workers = max_workers
+        self.ocr_batch_size = ocr_batch_size
+        self.use_gpu_ocr = use_gpu_ocr
+        self.max_detail_pages = max_detail_pages
+        self.max_url_workers = max_url_workers
+        self.head_check = head_check
+        # ページの取得（本体・詳細ページ）は同じホストへ2秒間隔、画像とHEADは間隔を短くして別に制限する
+        # （HEADの事前確認が本体のGETの枠を先に使い、GETを遅らせないようにするため）
+        self._rate_limiter = HostRateLimiter(interval=2.0)
+        self._image_rate_limiter = HostRateLimiter(interval=0.25)
+        self._head_rate_limiter = HostRateLimiter(interval=0.25)
+        self._page_cache = PageResultCache(page_cache_path, ttl=page_cache_ttl) if page_cache_path else None
+        self._http_cache = HttpResponseCache(http_cache_path, ttl=http_cache_ttl) if http_cache_path else None
+        # フィルタリングは正規表現中心のCPU処理でGILを保持するため、別プロセスで並列化できるようにする
+        self.filter_processes = filter_processes
+        self._filter_executor = None
+        self._filter_executor_lock = threading.Lock()
         self.driver = None
+        self._renderer = None
+        # Seleniumドライバーはスレッドセーフではないためロックで保護する
+        self._driver_lock = threading.Lock()
+        # EasyOCRのリーダーは全スレッドで共有するので、推論は1つずつ実行する
+        self._ocr_lock = threading.Lock()
+        # 同じHTMLを何度も解析しないためのキャッシュ（HTMLのハッシュ -> BeautifulSoup）
+        self._soup_cache = OrderedDict()
+        self._soup_cache_size = 8
+        self._soup_cache_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
         })
+        # 一時的なエラー（502など）でSeleniumへのフォールバックにならないよう、バックオフ付きで再試行する
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # 同じホストへの接続（TCP/TLS）を使い回すためのプール
+        # サイト単位の並列数 x ページ内の並列数まで同時接続がありうるので、それに合わせて広げる
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=32,
+                              pool_maxsize=max(64, max_workers * max_url_workers))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # クロール中にOCR済みの画像URL -> 抽出テキスト
+        self._image_texts = {}
 
         # OCR機能の初期化
         self.ocr_reader = None
+        self._ocr_on_gpu = False
+        self._ocr_cache = None
         if self.use_ocr:
             self._initialize_ocr()
+            if ocr_cache_path:
+                self._ocr_cache = OCRCache(ocr_cache_path)
 
-        # Seleniumドライバーの初期化（エラーハンドリング付き）
-        self._initialize_driver()
+        # ブラウザの初期化（Playwrightが使えない場合はSelenium、エラーハンドリング付き）
+        if browser == 'playwright':
+            self._initialize_renderer()
+        if self._renderer is None:
+            self._initialize_driver()
 
         # 拡張されたポートフォリオキーワード
         self.portfolio_keywords = [
@@ -90,77 +965,26 @@ class PortfolioScraper:
             'investment', 'invest', '出資先', '投資企業', '投資実績',
             'portfolio companies', 'portfolio companies', '投資対象企業'
         ]
+        self._portfolio_keyword_re = _keyword_regex(set(self.portfolio_keywords))
 
-        # 会社名のパターン（改善版）
+        # 会社名のパターン（法人格の接尾辞はモジュールレベルの統合パターンで処理）
         self.company_patterns = [
-            # 日本語の会社形態
-            r'株式会社\s*([^\s]+)',
-            r'有限会社\s*([^\s]+)',
-            r'合同会社\s*([^\s]+)',
-            r'([^\s]+)\s*株式会社',
-            r'([^\s]+)\s*有限会社',
-            r'([^\s]+)\s*合同会社',
-            r'([^\s]+)\s*㈱',
-            r'([^\s]+)\s*㈲',
-            r'([^\s]+)\s*㈳',
-
-            # 英語の会社形態
-            r'([^\s]+)\s*Inc\.',
-            r'([^\s]+)\s*Corp\.',
-            r'([^\s]+)\s*LLC',
-            r'([^\s]+)\s*Ltd\.',
-            r'([^\s]+)\s*Co\.',
-            r'([^\s]+)\s*Company',
-            r'([^\s]+)\s*Technologies',
-            r'([^\s]+)\s*Systems',
-            r'([^\s]+)\s*Solutions',
-            r'([^\s]+)\s*Group',
-            r'([^\s]+)\s*Partners',
-            r'([^\s]+)\s*Ventures',
-            r'([^\s]+)\s*Capital',
-            r'([^\s]+)\s*Fund',
-            r'([^\s]+)\s*Studio',
-            r'([^\s]+)\s*Labs',
-            r'([^\s]+)\s*Works',
-            r'([^\s]+)\s*Services',
-            r'([^\s]+)\s*Platform',
-            r'([^\s]+)\s*Network',
-            r'([^\s]+)\s*Media',
-            r'([^\s]+)\s*Digital',
-            r'([^\s]+)\s*Tech',
-            r'([^\s]+)\s*AI',
-            r'([^\s]+)\s*Bio',
-            r'([^\s]+)\s*Health',
-            r'([^\s]+)\s*Care',
-            r'([^\s]+)\s*Life',
-            r'([^\s]+)\s*Food',
-            r'([^\s]+)\s*Energy',
-            r'([^\s]+)\s*Green',
-            r'([^\s]+)\s*Eco',
-            r'([^\s]+)\s*Smart',
-            r'([^\s]+)\s*Next',
-            r'([^\s]+)\s*Future',
-            r'([^\s]+)\s*Global',
-            r'([^\s]+)\s*World',
-            r'([^\s]+)\s*International',
-            r'([^\s]+)\s*Japan',
-            r'([^\s]+)\s*Asia',
-            r'([^\s]+)\s*Pacific',
-            r'([^\s]+)\s*America',
-            r'([^\s]+)\s*Europe',
-
-            # 一般的な会社名パターン
             r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',  # キャピタライズされた単語
             r'([A-Z]{2,}(?:\s+[A-Z]{2,})*)',  # 大文字の略語
         ]
+        self._company_regexes = [re.compile(p) for p in self.company_patterns]
 
     def _initialize_ocr(self):
         """OCR機能の初期化"""
         try:
             if OCR_AVAILABLE:
-                import easyocr
-                self.ocr_reader = easyocr.Reader(['ja', 'en'])
-                logger.info("EasyOCR initialized successfully")
+                if self.use_gpu_ocr:
+                    import torch
+                    self._ocr_on_gpu = torch.cuda.is_available()
+                    if not self._ocr_on_gpu:
+                        logger.warning("CUDAが利用できないためEasyOCRはCPUで実行します")
+                self.ocr_reader = _get_ocr_reader(gpu=self._ocr_on_gpu)
+                logger.info(f"EasyOCR initialized successfully (gpu={self._ocr_on_gpu})")
             elif TESSERACT_AVAILABLE:
                 logger.info("Tesseract available for OCR")
             else:
@@ -169,6 +993,21 @@ class PortfolioScraper:
             logger.error(f"OCR初期化エラー: {e}")
             self.ocr_reader = None
 
+    def _initialize_renderer(self):
+        """Playwrightの初期化"""
+        if not PLAYWRIGHT_AVAILABLE:
+            logger.warning("playwrightが利用できないためSeleniumを使用します（pip install playwright）")
+            return
+        try:
+            self._renderer = PlaywrightRenderer(
+                headless=self.headless, timeout=self.timeout,
+                user_agent=self.session.headers['User-Agent']
+            )
+            logger.info("Playwrightの初期化に成功しました")
+        except Exception as e:
+            logger.warning(f"Playwrightの初期化に失敗したためSeleniumを使用します: {e}")
+            self._renderer = None
+
     def _initialize_driver(self):
         """Seleniumドライバーの初期化（改善版）"""
         try:
@@ -185,17 +1024,20 @@ class PortfolioScraper:
             # 追加の安定性オプション
             chrome_options.add_argument('--disable-extensions')
             chrome_options.add_argument('--disable-plugins')
-            chrome_options.add_argument('--disable-images')
-            chrome_options.add_argument('--disable-javascript')
             chrome_options.add_argument('--disable-web-security')
             chrome_options.add_argument('--allow-running-insecure-content')
+            # 画像の読み込みはコンテンツ設定で止める（OCR用の画像はsrcからrequestsで取得する）
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.default_content_setting_values.notifications': 2
+            })
 
             # WebDriver Managerを使用してドライバーを取得
             try:
                 service = Service(ChromeDriverManager().install())
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
                 self.driver.set_page_load_timeout(self.timeout)
-                self.driver.implicitly_wait(10)
+                self._configure_network()
                 logger.info("Seleniumドライバーの初期化に成功しました")
             except Exception as e:
                 logger.warning(f"WebDriver Managerでの初期化に失敗: {e}")
@@ -203,7 +1045,7 @@ class PortfolioScraper:
                 try:
                     self.driver = webdriver.Chrome(options=chrome_options)
                     self.driver.set_page_load_timeout(self.timeout)
-                    self.driver.implicitly_wait(10)
+                    self._configure_network()
                     logger.info("システムのChromeDriverで初期化に成功しました")
                 except Exception as e2:
                     logger.error(f"システムのChromeDriverでも初期化に失敗: {e2}")
@@ -213,17 +1055,14 @@ class PortfolioScraper:
             logger.error(f"Seleniumドライバーの初期化に失敗しました: {e}")
             self.driver = None
 
-    def setup_ocr(self):
-        """OCR機能の初期化"""
-        self.ocr_reader = None
-        if OCR_AVAILABLE:
-            try:
-                # 日本語と英語に対応
-                self.ocr_reader = easyocr.Reader(['ja', 'en'], gpu=False)
-                logger.info("EasyOCR initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize EasyOCR: {e}")
-                self.ocr_reader = None
+    def _configure_network(self):
+        """CDPで広告・トラッカー・動画などの不要なリクエストを遮断し、HTTPキャッシュを有効にする"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            self.driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': False})
+        except Exception as e:
+            logger.debug(f"CDPによるネットワーク設定に失敗: {e}")
 
     def setup_driver(self, headless: bool):
         """Seleniumドライバーの設定"""
@@ -255,48 +1094,119 @@ class PortfolioScraper:
         Returns:
             ポートフォリオURL、見つからない場合はNone
         """
-        # 1. リンク要素からポートフォリオタブを探す
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '').lower()
-            text = link.get_text().lower()
+        links = ((link['href'], link.get_text()) for link in soup.find_all('a', href=True))
+        meta_contents = (meta.get('content', '') for meta in soup.find_all('meta'))
+        return self._select_portfolio_url(links, meta_contents, base_url)
+
+    def find_portfolio_tab_in_html(self, html: bytes, base_url: str) -> Optional[str]:
+        """
+        ポートフォリオタブを探す（BeautifulSoupを使わずlxmlで直接解析する高速版）
+
+        Args:
+            html: ページのHTML
+            base_url: ベースURL
+
+        Returns:
+            ポートフォリオURL、見つからない場合はNone
+        """
+        try:
+            tree = lxml.html.fromstring(html)
+        except (ParserError, ValueError):
+            return self.find_portfolio_tab(self._parse_html(html, parse_only=PORTFOLIO_TAB_STRAINER), base_url)
+
+        links = ((link.get('href'), link.text_content()) for link in tree.iterfind('.//a[@href]'))
+        meta_contents = (meta.get('content', '') for meta in tree.iter('meta'))
+        return self._select_portfolio_url(links, meta_contents, base_url)
 
-            # 拡張されたキーワードマッチング
-            for keyword in self.portfolio_keywords:
-                if keyword in href or keyword in text:
-                    portfolio_url = urljoin(base_url, link['href'])
-                    logger.info(f"Portfolioタブを発見: {portfolio_url}")
-                    return portfolio_url
+    def _select_portfolio_url(self, links, meta_contents, base_url: str) -> Optional[str]:
+        """
+        リンク（href, テキスト）とmetaのcontentからポートフォリオURLを選ぶ
+
+        Args:
+            links: (href, リンクテキスト) のイテラブル
+            meta_contents: metaタグのcontentのイテラブル
+            base_url: ベースURL
+
+        Returns:
+            ポートフォリオURL、見つからない場合はNone
+        """
+        # 1. リンク要素からポートフォリオタブを探す
+        for raw_href, raw_text in links:
+            href = raw_href.lower()
+            text = raw_text.lower()
+
+            # 拡張されたキーワードマッチング（全キーワードを1回の走査で照合）
+            if self._portfolio_keyword_re.search(href) or self._portfolio_keyword_re.search(text):
+                portfolio_url = urljoin(base_url, raw_href)
+                logger.info(f"Portfolioタブを発見: {portfolio_url}")
+                return portfolio_url
 
             # 特殊なケース: ANRIのような企業
             if 'anri' in base_url.lower() and ('portfolio' in href or 'companies' in href):
-                portfolio_url = urljoin(base_url, link['href'])
+                portfolio_url = urljoin(base_url, raw_href)
                 logger.info(f"ANRI特殊ケース - Portfolioタブを発見: {portfolio_url}")
                 return portfolio_url
 
         # 2. 現在のページがポートフォリオページかチェック
         current_url = base_url.lower()
-        for keyword in self.portfolio_keywords:
-            if keyword in current_url:
-                logger.info(f"現在のページがポートフォリオページ: {base_url}")
-                return base_url
+        if self._portfolio_keyword_re.search(current_url):
+            logger.info(f"現在のページがポートフォリオページ: {base_url}")
+            return base_url
 
         # 3. メタデータからポートフォリオ情報を探す
-        meta_tags = soup.find_all('meta')
-        for meta in meta_tags:
-            content = meta.get('content', '').lower()
-            if any(keyword in content for keyword in self.portfolio_keywords):
+        for raw_content in meta_contents:
+            content = raw_content.lower()
+            if self._portfolio_keyword_re.search(content):
                 logger.info(f"メタデータからポートフォリオ情報を発見: {content}")
                 return base_url
 
         logger.warning(f"ポートフォリオタブが見つかりません: {base_url}")
         return None
 
-    def extract_text_from_image(self, img_url: str) -> Optional[str]:
+    def _download_image(self, img_url: str, fetch_failures: Optional[List[str]] = None) -> Optional[bytes]:
+        """
+        画像をダウンロード（スレッドプールから並列に呼ばれる）
+
+        Args:
+            img_url: 画像のURL
+            fetch_failures: 通信エラーで取得できなかった場合にURLを追加するリスト
+
+        Returns:
+            画像のバイト列、失敗時はNone
+        """
+        try:
+            self._image_rate_limiter.wait(img_url)
+            with self.session.get(img_url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+
+                content_length = response.headers.get('Content-Length')
+                if content_length and content_length.isdigit() and int(content_length) > MAX_IMAGE_BYTES:
+                    logger.debug(f"画像サイズが大きすぎるためスキップ: {img_url}")
+                    return None
+
+                # Content-Lengthがない場合も上限を超えたら読み込みを打ち切る
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    size += len(chunk)
+                    if size > MAX_IMAGE_BYTES:
+                        logger.debug(f"画像サイズが大きすぎるためスキップ: {img_url}")
+                        return None
+                    chunks.append(chunk)
+                return b''.join(chunks)
+        except Exception as e:
+            logger.warning(f"画像のダウンロードに失敗: {img_url} - {e}")
+            if fetch_failures is not None:
+                fetch_failures.append(img_url)
+            return None
+
+    def extract_text_from_image(self, img_url: str, image_bytes: Optional[bytes] = None) -> Optional[str]:
         """
         画像からテキストを抽出（OCR）- 改善版
 
         Args:
             img_url: 画像のURL
+            image_bytes: ダウンロード済みの画像データ（省略時はimg_urlから取得）
 
         Returns:
             抽出されたテキスト、失敗時はNone
@@ -304,36 +1214,163 @@ class PortfolioScraper:
         if not self.use_ocr:
             return None
 
-        try:
-            # 画像をダウンロード
-            response = self.session.get(img_url, timeout=15)
-            response.raise_for_status()
+        if image_bytes is None:
+            image_bytes = self._download_image(img_url)
+            if image_bytes is None:
+                return None
 
-            # PILで画像を開く
-            img = Image.open(io.BytesIO(response.content))
+        return self.extract_texts_from_images([(img_url, image_bytes)])[0]
 
-            # 画像の品質チェック
-            if not self._is_image_quality_good(img):
-                logger.debug(f"画像品質が低いためスキップ: {img_url}")
-                return None
+    def extract_texts_from_images(self, images: List[Tuple[str, Optional[bytes]]]) -> List[Optional[str]]:
+        """
+        複数の画像からまとめてテキストを抽出（OCR）
 
-            # 画像の前処理
-            processed_img = self._preprocess_image(img)
+        EasyOCRの推論はバッチ単位で実行し、結果は入力と同じ順序で返す。
 
-            # 複数のOCRエンジンで試行
-            extracted_text = self._try_multiple_ocr(processed_img, img_url)
+        Args:
+            images: (画像URL, 画像データ) のリスト
 
-            if extracted_text:
-                # テキストの後処理
-                cleaned_text = self._postprocess_text(extracted_text)
-                if cleaned_text:
-                    logger.debug(f"OCR成功: {img_url} -> {cleaned_text}")
-                    return cleaned_text
+        Returns:
+            画像ごとの抽出テキスト（失敗時はNone）
+        """
+        texts: List[Optional[str]] = [None] * len(images)
+        if not self.use_ocr:
+            return texts
 
-        except Exception as e:
-            logger.warning(f"画像からのテキスト抽出に失敗: {img_url} - {e}")
+        from PIL import Image
 
-        return None
+        # キャッシュ確認・品質チェック・前処理を先に済ませる
+        pending = []
+        for index, (img_url, image_bytes) in enumerate(images):
+            if image_bytes is None:
+                continue
+
+            # 同じ画像は内容のハッシュでキャッシュから返す
+            cache_key = None
+            if self._ocr_cache is not None:
+                cache_key = OCRCache.make_key(image_bytes)
+                hit, cached_text = self._ocr_cache.get(cache_key)
+                if hit:
+                    logger.debug(f"OCRキャッシュヒット: {img_url} -> {cached_text}")
+                    texts[index] = cached_text
+                    continue
+
+            try:
+                # PILで画像を開く
+                img = Image.open(io.BytesIO(image_bytes))
+
+                # 画像の品質チェック
+                if not self._is_image_quality_good(img):
+                    logger.debug(f"画像品質が低いためスキップ: {img_url}")
+                    self._store_ocr_result(cache_key, None)
+                    continue
+
+                # 画像の前処理
+                processed_img = self._preprocess_image(img)
+
+                # 文字を含まなそうな画像はOCRエンジンにかけず、ファイル名からの推測だけ行う
+                # （推測結果はURLに依存するので、画像内容をキーにしたキャッシュには保存しない）
+                if not self._is_likely_textual(processed_img, img_url):
+                    texts[index] = self._filename_candidate(img_url)
+                    continue
+
+                pending.append((index, img_url, cache_key, processed_img))
+
+            except Exception as e:
+                logger.warning(f"画像からのテキスト抽出に失敗: {img_url} - {e}")
+
+        if not pending:
+            return texts
+
+        # EasyOCRはまとめて推論する
+        batch_results = self._readtext_batched([processed_img for _, _, _, processed_img in pending])
+
+        for (index, img_url, cache_key, processed_img), easyocr_results in zip(pending, batch_results):
+            try:
+                # 複数のOCRエンジンで試行
+                extracted_text = self._try_multiple_ocr(processed_img, img_url, easyocr_results)
+
+                if extracted_text:
+                    # テキストの後処理
+                    cleaned_text = self._postprocess_text(extracted_text)
+                    if cleaned_text:
+                        logger.debug(f"OCR成功: {img_url} -> {cleaned_text}")
+                        self._store_ocr_result(cache_key, cleaned_text)
+                        texts[index] = cleaned_text
+                        continue
+
+                # OCRで読めなかった画像は失敗としてキャッシュし、ファイル名からの推測はキャッシュせずに使う
+                self._store_ocr_result(cache_key, None)
+                texts[index] = self._filename_candidate(img_url)
+
+            except Exception as e:
+                logger.warning(f"画像からのテキスト抽出に失敗: {img_url} - {e}")
+
+        return texts
+
+    def _readtext_batched(self, images: List[np.ndarray]) -> List[Optional[list]]:
+        """
+        EasyOCRで複数画像をバッチ推論
+
+        readtext_batchedは全画像を同じサイズに揃えて入力するため、
+        正方形にパディングしてから縮尺だけが変わるようにする。
+
+        Args:
+            images: 前処理された画像のリスト
+
+        Returns:
+            画像ごとのreadtext結果（失敗時はNoneで、個別に再試行される）
+        """
+        results: List[Optional[list]] = [None] * len(images)
+        if not self.ocr_reader:
+            return results
+
+        for start in range(0, len(images), self.ocr_batch_size):
+            chunk = [self._pad_to_square(arr) for arr in images[start:start + self.ocr_batch_size]]
+            side = max(arr.shape[0] for arr in chunk)
+            try:
+                with self._ocr_lock, self._ocr_precision():
+                    chunk_results = self.ocr_reader.readtext_batched(
+                        chunk, n_width=side, n_height=side, batch_size=self.ocr_batch_size
+                    )
+                results[start:start + len(chunk)] = chunk_results
+            except Exception as e:
+                logger.debug(f"EasyOCRのバッチ推論に失敗: {e}")
+
+        return results
+
+    def _ocr_precision(self):
+        """
+        EasyOCR推論時の精度コンテキスト
+
+        GPU実行時はautocastで畳み込み・行列演算をFP16にする。
+        EasyOCRは内部でFP32のテンソルを入力するため、モデル自体をhalf()にはしない。
+        """
+        if self._ocr_on_gpu:
+            import torch
+            return torch.autocast('cuda', dtype=torch.float16)
+        return contextlib.nullcontext()
+
+    @staticmethod
+    def _pad_to_square(arr: np.ndarray) -> np.ndarray:
+        """画像を白で右下にパディングして正方形にする"""
+        import numpy as np
+
+        height, width = arr.shape[:2]
+        side = max(height, width)
+        if height == width:
+            return arr
+        pad = ((0, side - height), (0, side - width)) + ((0, 0),) * (arr.ndim - 2)
+        return np.pad(arr, pad, mode='constant', constant_values=255)
+
+    def _store_ocr_result(self, cache_key: Optional[str], text: Optional[str]):
+        """OCR結果をキャッシュに保存"""
+        if self._ocr_cache is None or cache_key is None:
+            return
+        try:
+            self._ocr_cache.set(cache_key, text)
+        except sqlite3.Error as e:
+            logger.debug(f"OCRキャッシュへの保存に失敗: {e}")
 
     def _is_image_quality_good(self, img: Image.Image) -> bool:
         """
@@ -365,62 +1402,94 @@ class PortfolioScraper:
         except Exception:
             return False
 
-    def _preprocess_image(self, img: Image.Image) -> Image.Image:
+    def _is_likely_textual(self, arr: np.ndarray, img_url: str = '') -> bool:
         """
-        画像の前処理
+        文字を含む可能性がある画像かを簡易判定
+
+        ラプラシアンの分散（ぼけ・単色の検出）とエッジ密度（写真や装飾の検出）を見る。
 
         Args:
-            img: 元の画像
+            arr: 前処理された画像
+            img_url: 画像URL（ログ用）
 
         Returns:
-            前処理された画像
+            OCRを実行する価値がある場合はTrue
         """
+        import cv2
+        import numpy as np
+
         try:
-            # RGBに変換
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
+            gray = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
 
-            # 画像サイズの調整（大きすぎる場合は縮小）
-            max_size = 1024
-            if max(img.size) > max_size:
-                ratio = max_size / max(img.size)
-                new_size = tuple(int(dim * ratio) for dim in img.size)
-                img = img.resize(new_size, Image.Resampling.LANCZOS)
+            lap_var = cv2.Laplacian(gray, cv2.CV_64F).var()
+            if lap_var <= 100:
+                logger.debug(f"ぼけ・単色の画像のためOCRをスキップ (laplacian={lap_var:.1f}): {img_url}")
+                return False
 
-            # コントラストと明度の調整
-            from PIL import ImageEnhance
+            edge_density = np.mean(cv2.Canny(gray, 50, 150) > 0)
+            if not 0.02 < edge_density < 0.4:
+                logger.debug(f"エッジ密度が範囲外のためOCRをスキップ (edges={edge_density:.3f}): {img_url}")
+                return False
 
-            # コントラストを少し上げる
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(1.2)
+            return True
 
-            # 明度を調整
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(1.1)
+        except Exception:
+            # 判定できない場合はOCRに任せる
+            return True
+
+    def _preprocess_image(self, img: Image.Image) -> np.ndarray:
+        """
+        画像の前処理
 
-            return img
+        リサイズとコントラスト・明度の調整をOpenCVで行い、配列のまま返す。
+
+        Args:
+            img: 元の画像
+
+        Returns:
+            前処理された画像（RGBのndarray）
+        """
+        import cv2
+        import numpy as np
+
+        arr = np.asarray(img.convert('RGB') if img.mode != 'RGB' else img)
+        try:
+            # 画像サイズの調整（大きすぎる場合は縮小）
+            max_size = 1024
+            height, width = arr.shape[:2]
+            if max(height, width) > max_size:
+                ratio = max_size / max(height, width)
+                new_size = (int(width * ratio), int(height * ratio))
+                arr = cv2.resize(arr, new_size, interpolation=cv2.INTER_LANCZOS4)
+
+            # コントラストと明度の調整（dst = alpha * src + beta を1パスで適用）
+            return cv2.convertScaleAbs(arr, alpha=1.2, beta=25)
 
         except Exception as e:
             logger.debug(f"画像前処理に失敗: {e}")
-            return img
+            return arr
 
-    def _try_multiple_ocr(self, img: Image.Image, img_url: str) -> Optional[str]:
+    def _try_multiple_ocr(self, img: np.ndarray, img_url: str,
+                          easyocr_results: Optional[list] = None) -> Optional[str]:
         """
         複数のOCRエンジンでテキスト抽出を試行
 
         Args:
             img: 前処理された画像
             img_url: 画像URL（ログ用）
+            easyocr_results: バッチ推論済みのEasyOCR結果（省略時はここで推論）
 
         Returns:
-            抽出されたテキスト
+            抽出されたテキスト（どのエンジンでも読めなければNone。ファイル名からの推測は呼び出し側で行う）
         """
         # 1. EasyOCRを試行
         if self.ocr_reader:
             try:
-                results = self.ocr_reader.readtext(np.array(img))
+                if easyocr_results is None:
+                    with self._ocr_lock, self._ocr_precision():
+                        easyocr_results = self.ocr_reader.readtext(img)
                 texts = []
-                for result in results:
+                for result in easyocr_results:
                     text, confidence = result[1], result[2]
                     # 信頼度が50%以上の場合のみ使用
                     if confidence > 0.5 and len(text.strip()) > 1:
@@ -437,6 +1506,8 @@ class PortfolioScraper:
         # 2. Tesseractを試行
         if TESSERACT_AVAILABLE:
             try:
+                import pytesseract
+
                 # 日本語と英語の両方で試行
                 text_jp = pytesseract.image_to_string(img, lang='jpn+eng')
                 text_en = pytesseract.image_to_string(img, lang='eng')
@@ -454,8 +1525,16 @@ class PortfolioScraper:
             except Exception as e:
                 logger.debug(f"Tesseract失敗: {img_url} - {e}")
 
-        # 3. 画像のalt属性やファイル名から推測
-        return self._extract_text_from_filename(img_url)
+        return None
+
+    def _filename_candidate(self, img_url: str) -> Optional[str]:
+        """
+        OCRの代わりにファイル名から推測したテキスト（後処理済み）
+
+        画像のURLに依存するため、画像内容をキーにしたOCRキャッシュには保存しない。
+        """
+        filename_text = self._extract_text_from_filename(img_url)
+        return self._postprocess_text(filename_text) if filename_text else None
 
     def _extract_text_from_filename(self, img_url: str) -> Optional[str]:
         """
@@ -475,12 +1554,10 @@ class PortfolioScraper:
             name_without_ext = filename.rsplit('.', 1)[0] if '.' in filename else filename
 
             # アンダースコアやハイフンをスペースに変換
-            name_cleaned = name_without_ext.replace('_', ' ').replace('-', ' ').replace('+', ' ')
+            name_cleaned = name_without_ext.translate(_FILENAME_SEP_TRANS)
 
             # 数字や特殊文字を除去
-            import re
-            name_cleaned = re.sub(r'[0-9]+', '', name_cleaned)
-            name_cleaned = re.sub(r'[^\w\s]', '', name_cleaned)
+            name_cleaned = _FILENAME_STRIP_RE.sub('', name_cleaned)
 
             # 複数のスペースを単一スペースに
             name_cleaned = ' '.join(name_cleaned.split())
@@ -505,33 +1582,19 @@ class PortfolioScraper:
             後処理されたテキスト
         """
         try:
-            # 基本的なクリーニング
-            text = text.strip()
-
-            # 改行やタブをスペースに変換
-            text = re.sub(r'[\n\r\t]+', ' ', text)
-
-            # 複数のスペースを単一スペースに
-            text = re.sub(r'\s+', ' ', text)
+            # 前後の空白を除き、改行・タブ・連続スペースを単一スペースに
+            text = ' '.join(text.split())
 
             # 特殊文字の除去（ただし日本語と英語は保持）
-            text = re.sub(r'[^\w\s\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]', '', text)
+            text = _KEEP_RE.sub('', text)
 
             # 短すぎるテキストは除外
             if len(text) < 2:
                 return None
 
             # 明らかに会社名でないものを除外
-            exclude_patterns = [
-                r'^[0-9]+$',  # 数字のみ
-                r'^[a-zA-Z]{1,2}$',  # 1-2文字のアルファベット
-                r'^(click|read|more|view|learn|see|home|about|contact)$',  # 一般的なナビゲーション用語
-                r'^(logo|image|photo|picture|icon)$',  # 画像関連用語
-            ]
-
-            for pattern in exclude_patterns:
-                if re.match(pattern, text.lower()):
-                    return None
+            if _POSTPROCESS_EXCLUDE_RE.match(text.lower()):
+                return None
 
             return text
 
@@ -539,20 +1602,19 @@ class PortfolioScraper:
             logger.debug(f"テキスト後処理失敗: {e}")
             return None
 
-    def click_image_and_extract_company(self, img_element, base_url: str) -> Optional[str]:
+    def click_image_and_extract_company(self, img_element, base_url: str,
+                                        fetch_failures: Optional[List[str]] = None) -> Optional[str]:
         """
         画像をクリックして詳細ページから会社名を抽出
 
         Args:
             img_element: 画像要素
             base_url: ベースURL
+            fetch_failures: 詳細ページを取得できなかった場合にURLを追加するリスト
 
         Returns:
             会社名、失敗時はNone
         """
-        if not self.driver:
-            return None
-
         try:
             # 画像の親要素がリンクかチェック
             parent_link = img_element.find_parent('a')
@@ -564,78 +1626,107 @@ class PortfolioScraper:
                 return None
 
             detail_url = urljoin(base_url, href)
+            detail_soup = self._fetch_detail_page(detail_url)
+            if detail_soup is None:
+                if fetch_failures is not None:
+                    fetch_failures.append(detail_url)
+                return None
 
-            # 詳細ページを開く
-            self.driver.get(detail_url)
-            time.sleep(2)
-
-            # 詳細ページから会社名を抽出
-            detail_soup = BeautifulSoup(self.driver.page_source, 'lxml')
-            companies = self.extract_companies_from_page(detail_soup)
+            # 詳細ページから会社名を抽出（詳細ページ内の画像はOCRにかけず、入れ子のスレッドプールも作らない）
+            companies = self.extract_companies_from_page(detail_soup, use_ocr=False)
 
             if companies:
                 return list(companies)[0]  # 最初の会社名を返す
 
         except Exception as e:
             logger.warning(f"画像クリックによる詳細ページ取得に失敗: {e}")
+            if fetch_failures is not None:
+                fetch_failures.append(base_url)
 
         return None
 
-    def extract_companies_from_page(self, soup: BeautifulSoup, base_url: str = "") -> Set[str]:
+    def _fetch_detail_page(self, detail_url: str) -> Optional[BeautifulSoup]:
+        """
+        詳細ページを取得
+
+        ほとんどの詳細ページは静的HTMLなのでrequestsで取得し、
+        見出しや本文が見つからない場合（JavaScriptで描画されるページ）だけSeleniumを使う。
+
+        Args:
+            detail_url: 詳細ページのURL
+
+        Returns:
+            BeautifulSoupオブジェクト、失敗時はNone
+        """
+        detail_soup = None
+        try:
+            self._rate_limiter.wait(detail_url)
+            response = self.session.get(detail_url, timeout=self.timeout)
+            response.raise_for_status()
+            detail_soup = self._parse_html(response.content)
+            if _DETAIL_READY_SV.select_one(detail_soup) is not None:
+                return detail_soup
+        except Exception as e:
+            logger.debug(f"requestsでの詳細ページ取得に失敗: {detail_url} - {e}")
+
+        if self._renderer is not None:
+            try:
+                self._rate_limiter.wait(detail_url)
+                return self._parse_html(self._renderer.render(detail_url, ready_selector=DETAIL_READY_SELECTOR, ready_timeout=5))
+            except Exception as e:
+                logger.debug(f"Playwrightでの詳細ページ取得に失敗: {detail_url} - {e}")
+                return detail_soup
+
+        if not self.driver:
+            return detail_soup
+
+        # 詳細ページを開き、見出しか本文が現れるまで待つ
+        self._rate_limiter.wait(detail_url)
+        with self._driver_lock:
+            self.driver.get(detail_url)
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_READY_SELECTOR))
+                )
+            except TimeoutException:
+                pass
+            page_source = self.driver.page_source
+
+        return self._parse_html(page_source)
+
+    def extract_companies_from_page(self, soup: BeautifulSoup, base_url: str = "", use_ocr: bool = True,
+                                    fetch_failures: Optional[List[str]] = None) -> Set[str]:
         """
         ページから会社名を抽出する（大幅改善版）
 
         Args:
             soup: BeautifulSoupオブジェクト
             base_url: ベースURL（画像クリック用）
+            use_ocr: 画像からの抽出を行うかどうか（OCR機能が有効な場合のみ）
+            fetch_failures: 画像・詳細ページの取得に失敗した場合にURLを追加するリスト
 
         Returns:
             会社名のセット
         """
         companies = set()
 
-        # 1. 特定のクラス名を持つ要素から会社名を抽出（優先度最高）
-        portfolio_selectors = [
-            '.fg-item-title',  # 15th Rock
-            '.card_companyName__BWs6G',  # ANRI
-            '.portfolioItem__title',  # サムライインキュベート
-            '.portfolio__item',  # ジェネシア
-            '[class*="company-name"]',
-            '[class*="companyName"]',
-            '[class*="fg-item-title"]',
-            '[class*="card_companyName"]',
-            '[class*="portfolio-item"]',
-            '[class*="portfolioItem"]',
-            'h2.fg-item-title',
-            'h3.card_companyName__BWs6G',
-            '.portfolio-item h2',
-            '.portfolio-item h3',
-            '.company-card h2',
-            '.company-card h3',
-            '.card h2',
-            '.card h3',
-            '.gallery-item h2',
-            '.gallery-item h3',
-            '.portfolio__item h3',
-            '.portfolio__item h2'
-        ]
+        # 木の走査は高コストなので、複数の手順で使う結果は最初に1回だけ取得する
+        img_tags = soup.find_all('img')
+        text_content = soup.get_text(separator=' ')
 
-        for selector in portfolio_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(strip=True)
-                if text and len(text) > 1 and len(text) < 100:
-                    clean_text = re.sub(r'[🇯🇵🇺🇸🇳🇱🇨🇦🇬🇧🇺🇸🇳🇱]', '', text).strip()
-                    if clean_text:
-                        companies.add(clean_text)
+        # 1. 特定のクラス名を持つ要素から会社名を抽出（優先度最高）
+        for element in _PORTFOLIO_SELECTOR_SV.select(soup):
+            self._add_text_candidate(companies, element.get_text(strip=True))
 
         # 2. 画像から会社名を抽出（OCR使用）
-        if self.use_ocr:
-            img_elements = soup.find_all('img')
+        if self.use_ocr and use_ocr:
             processed_images = 0
             successful_ocr = 0
 
-            for img in img_elements:
+            # 画像URLを先に集める（同じURLの画像は1回だけ処理する）
+            image_targets = []
+            seen_urls = set()
+            for img in img_tags:
                 src = img.get('src', '')
                 if src:
                     # 画像URLを完全なURLに変換
@@ -647,109 +1738,105 @@ class PortfolioScraper:
                         img_url = urljoin(base_url, src)
                     else:
                         img_url = src
-
-                    # 画像からテキスト抽出
-                    extracted_text = self.extract_text_from_image(img_url)
-                    processed_images += 1
-
-                    if extracted_text:
-                        successful_ocr += 1
-                        # 抽出されたテキストから会社名らしいものをフィルタリング
-                        words = extracted_text.split()
-                        for word in words:
-                            if (len(word) >= 2 and len(word) <= 50 and
-                                any(keyword in word.lower() for keyword in ['inc', 'corp', 'ltd', 'co', '株式会社', '有限会社', '合同会社'])):
-                                companies.add(word)
-
-                        # 抽出されたテキスト全体も追加（会社名の可能性がある場合）
-                        if len(extracted_text) >= 3 and len(extracted_text) <= 50:
-                            companies.add(extracted_text)
-
-                    # 画像クリックによる詳細ページ取得（限定的に実行）
-                    if base_url and processed_images <= 10:  # 最初の10枚のみ
-                        detail_company = self.click_image_and_extract_company(img, base_url)
+                    if img_url not in seen_urls:
+                        seen_urls.add(img_url)
+                        image_targets.append((img, img_url))
+
+            # このクロールですでにOCRした画像はダウンロードしない
+            new_urls = [url for _, url in image_targets if url not in self._image_texts]
+
+            # ダウンロードはI/O待ちなのでスレッドプールで並列に実行
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                image_contents = list(executor.map(
+                    lambda url: self._download_image(url, fetch_failures), new_urls
+                ))
+
+            # OCRはページ内の画像をまとめてバッチ推論する
+            new_texts = self.extract_texts_from_images(list(zip(new_urls, image_contents)))
+            for url, image_bytes, text in zip(new_urls, image_contents, new_texts):
+                if image_bytes is not None:
+                    self._image_texts[url] = text
+            extracted_texts = [self._image_texts.get(url) for _, url in image_targets]
+
+            for extracted_text in extracted_texts:
+                processed_images += 1
+
+                if extracted_text:
+                    successful_ocr += 1
+                    # 抽出されたテキストから会社名らしいものをフィルタリング
+                    words = extracted_text.split()
+                    for word in words:
+                        if (len(word) >= 2 and len(word) <= 50 and
+                            _COMPANY_HINT_RE.search(word.lower())):
+                            companies.add(word)
+
+                    # 抽出されたテキスト全体も追加（会社名の可能性がある場合）
+                    if len(extracted_text) >= 3 and len(extracted_text) <= 50:
+                        companies.add(extracted_text)
+
+            # 画像クリックによる詳細ページ取得（requests中心になったので並列に実行）
+            if base_url:
+                detail_images = [img for img, _ in image_targets[:self.max_detail_pages]]
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    detail_companies = executor.map(
+                        lambda img: self.click_image_and_extract_company(img, base_url, fetch_failures), detail_images
+                    )
+                    for detail_company in detail_companies:
                         if detail_company:
                             companies.add(detail_company)
 
             logger.info(f"画像処理結果: {processed_images}枚処理, {successful_ocr}枚でOCR成功")
 
         # 3. リンク要素から会社名を抽出
-        link_selectors = [
-            'a[href*="http"]',  # 外部リンク
-            '.card a',
-            '.portfolio-item a',
-            '.company-card a',
-            '.gallery-item a',
-            '.portfolio__item a'
-        ]
-
-        for selector in link_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                # リンクテキストから会社名を抽出
-                text = element.get_text(strip=True)
-                if text and len(text) > 1 and len(text) < 100:
-                    clean_text = re.sub(r'[🇯🇵🇺🇸🇳🇱🇨🇦🇬🇧🇺🇸🇳🇱]', '', text).strip()
-                    if clean_text:
-                        companies.add(clean_text)
-
-                # alt属性から会社名を抽出
-                alt_text = element.get('alt', '')
-                if alt_text and len(alt_text) > 1 and len(alt_text) < 100:
-                    if any(keyword in alt_text.lower() for keyword in ['logo', 'company', 'corp', 'inc', 'ltd', '株式会社', '有限会社']):
-                        clean_text = re.sub(r'[🇯🇵🇺🇸🇳🇱🇨🇦🇬🇧🇺🇸🇳🇱]', '', alt_text).strip()
-                        if clean_text:
-                            companies.add(clean_text)
+        for element in _LINK_SELECTOR_SV.select(soup):
+            # リンクテキストから会社名を抽出
+            self._add_text_candidate(companies, element.get_text(strip=True))
+            # alt属性から会社名を抽出
+            self._add_text_candidate(companies, element.get('alt', ''), _LOGO_HINT_RE)
 
         # 4. 画像のalt属性から会社名を抽出
-        img_elements = soup.find_all('img')
-        for img in img_elements:
-            alt_text = img.get('alt', '')
-            if alt_text and len(alt_text) > 1 and len(alt_text) < 100:
-                if any(keyword in alt_text.lower() for keyword in ['logo', 'company', 'corp', 'inc', 'ltd', '株式会社', '有限会社']):
-                    clean_text = re.sub(r'[🇯🇵🇺🇸🇳🇱🇨🇦🇬🇧🇺🇸🇳🇱]', '', alt_text).strip()
-                    if clean_text:
-                        companies.add(clean_text)
-
-        # 5. 見出し要素から会社名を抽出
-        heading_selectors = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
-        for selector in heading_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(strip=True)
-                if text and len(text) > 1 and len(text) < 100:
-                    if any(keyword in text.lower() for keyword in ['inc', 'corp', 'ltd', 'co', '株式会社', '有限会社', '合同会社']):
-                        clean_text = re.sub(r'[🇯🇵🇺🇸🇳🇱🇨🇦🇬🇧🇺🇸🇳🇱]', '', text).strip()
-                        if clean_text:
-                            companies.add(clean_text)
-
-        # 6. リスト要素から会社名を抽出
-        list_elements = soup.find_all(['ul', 'ol'])
-        for list_elem in list_elements:
-            items = list_elem.find_all('li')
-            for item in items:
-                text = item.get_text(strip=True)
-                if text and len(text) > 1 and len(text) < 100:
-                    if any(keyword in text.lower() for keyword in ['inc', 'corp', 'ltd', 'co', '株式会社', '有限会社', '合同会社']):
-                        clean_text = re.sub(r'[🇯🇵🇺🇸🇳🇱🇨🇦🇬🇧🇺🇸🇳🇱]', '', text).strip()
-                        if clean_text:
-                            companies.add(clean_text)
+        for img in img_tags:
+            self._add_text_candidate(companies, img.get('alt', ''), _LOGO_HINT_RE)
+
+        # 5-6. 見出し要素とリスト要素から会社名を抽出（1回の走査でまとめて処理）
+        for element in soup.find_all(HEADING_AND_LIST_TAGS):
+            self._add_text_candidate(companies, element.get_text(strip=True), _COMPANY_HINT_RE)
 
         # 7. 正規表現パターンマッチング（最後の手段）
-        text_content = soup.get_text()
-        for pattern in self.company_patterns:
-            matches = re.findall(pattern, text_content)
-            for match in matches:
-                if match and len(match.strip()) > 1 and len(match.strip()) < 100:
-                    clean_text = re.sub(r'[🇯🇵🇺🇸🇳🇱🇨🇦🇬🇧🇺🇸🇳🇱]', '', match.strip()).strip()
-                    if clean_text:
-                        companies.add(clean_text)
+        matches = [prefix or suffix for prefix, suffix in COMPANY_RE_JP.findall(text_content)]
+        matches.extend(COMPANY_RE_EN.findall(text_content))
+        for pattern in self._company_regexes:
+            matches.extend(pattern.findall(text_content))
+
+        for match in matches:
+            if match and len(match.strip()) > 1 and len(match.strip()) < 100:
+                clean_text = match.strip().translate(_FLAG_TRANS).strip()
+                if clean_text:
+                    companies.add(clean_text)
 
         # 最終的なフィルタリング
         companies = self._filter_company_names(companies)
 
         return companies
 
+    @staticmethod
+    def _add_text_candidate(companies: Set[str], text: str, hint_re: Optional[re.Pattern] = None):
+        """
+        要素のテキストが会社名の候補になりうる場合に追加
+
+        Args:
+            companies: 候補を追加するセット
+            text: 要素のテキスト
+            hint_re: 指定した場合、このパターンを含むテキストだけを候補にする
+        """
+        if not text or not 1 < len(text) < 100:
+            return
+        if hint_re is not None and not hint_re.search(text.lower()):
+            return
+        clean_text = text.translate(_FLAG_TRANS).strip()
+        if clean_text:
+            companies.add(clean_text)
+
     def _filter_company_names(self, companies: Set[str]) -> Set[str]:
         """
         会社名をフィルタリングしてノイズを除去（改善版）
@@ -760,215 +1847,60 @@ class PortfolioScraper:
         Returns:
             フィルタリングされた会社名のセット
         """
-        filtered_companies = set()
+        executor = self._get_filter_executor()
+        if executor is None:
+            return filter_company_names(companies)
 
-        # 除外すべきパターン
-        exclude_patterns = [
-            # 一般的なナビゲーション要素
-            r'^(top|home|about|contact|news|blog|careers|privacy|terms|login|signup|search)$',
-            r'^(menu|navigation|header|footer|sidebar|main|content)$',
-            r'^(next|previous|back|forward|close|open|expand|collapse)$',
-
-            # 一般的な単語
-            r'^(our|we|you|they|them|this|that|these|those)$',
-            r'^(the|and|or|but|for|with|from|to|in|on|at|by)$',
-            r'^(all|any|some|many|few|much|little|more|less)$',
-
-            # 技術的なノイズ
-            r'^[a-f0-9]{8,}$',  # 16進数文字列
-            r'^[a-z]{1,2}$',  # 1-2文字のアルファベット
-            r'^[0-9]+$',  # 数字のみ
-            r'^[a-z]+[0-9]+[a-z]+$',  # アルファベット+数字+アルファベット
-
-            # OCRノイズ
-            r'^[a-z]{3,}[a-z]{3,}[a-z]{3,}$',  # 繰り返し文字
-            r'^[a-z]+[a-z]+[a-z]+[a-z]+$',  # 4回以上の繰り返し
-
-            # 画像・ファイル関連
-            r'\.(png|jpg|jpeg|gif|svg|ico|webp)$',
-            r'^(logo|image|photo|picture|icon|img)$',
-            r'^(download|upload|file|document|pdf)$',
-            r'.*logo.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # ロゴファイル
-            r'.*_logo.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _logoを含むファイル
-            r'.*logo_.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # logo_を含むファイル
-            r'.*_edited.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _editedを含むファイル
-            r'.*_2025.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _2025を含むファイル
-            r'.*_2024.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _2024を含むファイル
-            r'.*_2023.*\.(png|jpg|jpeg|gif|svg|ico|webp)$',  # _2023を含むファイル
-
-            # 言語・地域関連
-            r'^(en|jp|ja|us|uk|eu|asia|pacific|global|world)$',
-            r'^(english|japanese|chinese|korean|spanish|french|german)$',
-
-            # 日付・時刻
-            r'^\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-            r'^\d{2}:\d{2}:\d{2}',  # HH:MM:SS
-            r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',  # ISO形式
-
-            # 特殊文字のみ
-            r'^[^\w\s]+$',
-
-            # 短すぎるテキスト
-            r'^.{1,2}$',
-
-            # 長すぎるテキスト（説明文など）
-            r'^.{100,}$',
-        ]
+        # 候補ごとに独立した判定なので、分割して各プロセスで処理し結果を合わせる
+        candidates = list(companies)
+        chunks = [set(candidates[i:i + FILTER_CHUNK_SIZE]) for i in range(0, len(candidates), FILTER_CHUNK_SIZE)]
+        filtered_companies = set()
+        for filtered_chunk in executor.map(filter_company_names, chunks):
+            filtered_companies |= filtered_chunk
+        return filtered_companies
 
-        # 除外すべきキーワード（厳しさを調整）
-        exclude_keywords = {
-            'copyright', 'privacy', 'terms', 'policy', 'legal', 'disclaimer',
-            'top', 'home', 'about', 'contact', 'news', 'blog', 'careers',
-            'menu', 'navigation', 'header', 'footer', 'sidebar',
-            'next', 'previous', 'back', 'forward', 'close', 'open',
-            'our', 'we', 'you', 'they', 'them', 'this', 'that',
-            'logo', 'image', 'photo', 'picture', 'icon', 'img',
-            'download', 'upload', 'file', 'document',
-            'en', 'jp', 'ja', 'us', 'uk', 'eu', 'asia', 'pacific',
-            'english', 'japanese', 'chinese', 'korean',
-            'all', 'any', 'some', 'many', 'few', 'much', 'little',
-            'the', 'and', 'or', 'but', 'for', 'with', 'from', 'to', 'in', 'on', 'at', 'by',
-            # UI要素（厳しさを調整）
-            'website', 'location', 'chevron', 'right', 'left', 'up', 'down',
-            'general', 'partner', 'lead', 'position', 'principal', 'associate',
-            'founder', 'ceo', 'cto', 'cfo', 'coo', 'director', 'manager',
-            'team', 'member', 'staff', 'employee', 'consultant', 'advisor',
-            'board', 'committee', 'council', 'group', 'division', 'department',
-            'section', 'unit', 'branch', 'office', 'location', 'address',
-            'phone', 'email', 'contact', 'support', 'help', 'info', 'information',
-            'service', 'services', 'product', 'products', 'solution', 'solutions',
-            'technology', 'technologies', 'innovation', 'research', 'development',
-            'investment', 'investments', 'portfolio', 'portfolios', 'company', 'companies',
-            'corporation', 'corporations', 'limited', 'incorporated', 'partnership',
-            'venture', 'ventures', 'capital', 'fund', 'funds', 'asset', 'assets',
-            'management', 'consulting', 'advisory', 'financial', 'banking',
-            'insurance', 'real estate', 'property', 'development', 'construction',
-            'manufacturing', 'production', 'distribution', 'retail', 'wholesale',
-            'trade', 'commerce', 'business', 'enterprise', 'startup', 'startups',
-            'scaleup', 'scaleups', 'growth', 'expansion', 'acquisition', 'merger',
-            'exit', 'exits', 'ipo', 'm&a', 'ma', 'deal', 'deals', 'transaction',
-            'round', 'series', 'seed', 'angel', 'pre-seed', 'pre-seed', 'pre-seed',
-            # 単一文字は除外
-            'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z'
-        }
+    def _get_filter_executor(self) -> Optional[ProcessPoolExecutor]:
+        """フィルタリング用のプロセスプールを返す（初回呼び出し時に生成、無効ならNone）"""
+        if self.filter_processes <= 0:
+            return None
+        with self._filter_executor_lock:
+            if self._filter_executor is None:
+                self._filter_executor = ProcessPoolExecutor(max_workers=self.filter_processes)
+            return self._filter_executor
 
-        for company in companies:
-            company_lower = company.lower().strip()
+    def _parse_html(self, html, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        HTMLを解析（同じ内容のHTMLはキャッシュ済みの解析結果を返す）
 
-            # 基本的な長さチェック
-            if len(company_lower) < 3 or len(company_lower) > 50:
-                continue
+        Args:
+            html: HTML文字列またはバイト列
+            parse_only: 指定した場合、一致する要素だけを解析する
 
-            # 除外キーワードチェック
-            if company_lower in exclude_keywords:
-                continue
+        Returns:
+            BeautifulSoupオブジェクト
+        """
+        data = html.encode('utf-8') if isinstance(html, str) else html
+        key = (hashlib.md5(data).digest(), id(parse_only) if parse_only is not None else None)
 
-            # 除外パターンチェック
-            should_exclude = False
-            for pattern in exclude_patterns:
-                if re.match(pattern, company_lower):
-                    should_exclude = True
-                    break
+        with self._soup_cache_lock:
+            soup = self._soup_cache.get(key)
+            if soup is not None:
+                self._soup_cache.move_to_end(key)
+                return soup
 
-            if should_exclude:
-                continue
+        soup = BeautifulSoup(html, 'lxml', parse_only=parse_only)
 
-            # 会社名らしいパターンチェック
-            company_patterns = [
-                r'.*株式会社.*',
-                r'.*有限会社.*',
-                r'.*合同会社.*',
-                r'.*Inc\.?$',
-                r'.*Corp\.?$',
-                r'.*LLC$',
-                r'.*Ltd\.?$',
-                r'.*Co\.?$',
-                r'.*Company$',
-                r'.*Technologies$',
-                r'.*Systems$',
-                r'.*Solutions$',
-                r'.*Group$',
-                r'.*Partners$',
-                r'.*Ventures$',
-                r'.*Capital$',
-                r'.*Fund$',
-                r'.*Studio$',
-                r'.*Labs$',
-                r'.*Works$',
-                r'.*Services$',
-                r'.*Platform$',
-                r'.*Network$',
-                r'.*Media$',
-                r'.*Digital$',
-                r'.*Tech$',
-                r'.*AI$',
-                r'.*Bio$',
-                r'.*Health$',
-                r'.*Care$',
-                r'.*Life$',
-                r'.*Food$',
-                r'.*Energy$',
-                r'.*Green$',
-                r'.*Eco$',
-                r'.*Smart$',
-                r'.*Next$',
-                r'.*Future$',
-                r'.*Global$',
-                r'.*World$',
-                r'.*International$',
-                r'.*Japan$',
-                r'.*Asia$',
-                r'.*Pacific$',
-                r'.*America$',
-                r'.*Europe$',
-            ]
-
-            # 会社名らしいパターンにマッチするかチェック
-            is_company_like = False
-            for pattern in company_patterns:
-                if re.match(pattern, company, re.IGNORECASE):
-                    is_company_like = True
-                    break
+        with self._soup_cache_lock:
+            self._soup_cache[key] = soup
+            while len(self._soup_cache) > self._soup_cache_size:
+                self._soup_cache.popitem(last=False)
 
-            # 会社名らしくない場合は、長さと内容で判断
-            if not is_company_like:
-                # 3-20文字で、大文字小文字が混在している場合は会社名の可能性
-                if (3 <= len(company) <= 20 and
-                    any(c.isupper() for c in company) and
-                    any(c.islower() for c in company)):
-                    # 追加チェック: 明らかなUI要素でないことを確認（厳しさを調整）
-                    obvious_ui_elements = ['website', 'location', 'chevron', 'right', 'left', 'up', 'down',
-                                          'general', 'partner', 'lead', 'position', 'principal', 'associate',
-                                          'founder', 'ceo', 'cto', 'cfo', 'coo', 'director', 'manager',
-                                          'team', 'member', 'staff', 'employee', 'consultant', 'advisor',
-                                          'board', 'committee', 'council', 'group', 'division', 'department',
-                                          'section', 'unit', 'branch', 'office', 'location', 'address',
-                                          'phone', 'email', 'contact', 'support', 'help', 'info', 'information',
-                                          'service', 'services', 'product', 'products', 'solution', 'solutions',
-                                          'technology', 'technologies', 'innovation', 'research', 'development',
-                                          'investment', 'investments', 'portfolio', 'portfolios', 'company', 'companies',
-                                          'corporation', 'corporations', 'limited', 'incorporated', 'partnership',
-                                          'venture', 'ventures', 'capital', 'fund', 'funds', 'asset', 'assets',
-                                          'management', 'consulting', 'advisory', 'financial', 'banking',
-                                          'insurance', 'real estate', 'property', 'development', 'construction',
-                                          'manufacturing', 'production', 'distribution', 'retail', 'wholesale',
-                                          'trade', 'commerce', 'business', 'enterprise', 'startup', 'startups',
-                                          'scaleup', 'scaleups', 'growth', 'expansion', 'acquisition', 'merger',
-                                          'exit', 'exits', 'ipo', 'm&a', 'ma', 'deal', 'deals', 'transaction',
-                                          'round', 'series', 'seed', 'angel', 'pre-seed', 'pre-seed', 'pre-seed']
-
-                    if not any(ui_element in company_lower for ui_element in obvious_ui_elements):
-                        is_company_like = True
-
-                # 追加: 日本語の会社名パターン
-                elif (3 <= len(company) <= 30 and
-                      any(ord(c) > 127 for c in company)):  # 非ASCII文字（日本語など）を含む
-                    is_company_like = True
-
-            if is_company_like:
-                filtered_companies.add(company)
+        return soup
 
-        return filtered_companies
+    def _clear_parse_cache(self):
+        """HTML解析キャッシュをクリア"""
+        with self._soup_cache_lock:
+            self._soup_cache.clear()
 
     def scrape_with_requests(self, url: str) -> Optional[BeautifulSoup]:
         """
@@ -980,15 +1912,73 @@ class PortfolioScraper:
         Returns:
             BeautifulSoupオブジェクト、失敗時はNone
         """
+        html = self._fetch_with_requests(url)
+        if html is None:
+            return None
+        return self._parse_html(html)
+
+    def _fetch_with_requests(self, url: str) -> Optional[bytes]:
+        """
+        requestsを使用してHTMLを取得（解析はしない）
+
+        Args:
+            url: スクレイピング対象のURL
+
+        Returns:
+            HTMLのバイト列、失敗時はNone
+        """
+        cached = self._http_cache.get(url) if self._http_cache is not None else None
+        if cached is not None:
+            is_fresh, etag, last_modified, body = cached
+            if is_fresh:
+                return body
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            # 期限切れのキャッシュがあれば、変更がない場合は本文なし（304）で済む条件付きリクエストにする
+            headers = {}
+            if cached is not None:
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            # 条件付きヘッダーがない場合はセッションのヘッダーをそのまま使う（空の辞書でもマージが走るため渡さない）
+            self._rate_limiter.wait(url)
+            response = self.session.get(url, timeout=self.timeout, headers=headers or None)
+            if response.status_code == 304 and cached is not None:
+                self._http_cache.touch(url)
+                return body
             response.raise_for_status()
-            response.encoding = response.apparent_encoding
-            return BeautifulSoup(response.content, 'lxml')
+            if self._http_cache is not None:
+                self._http_cache.set(url, response.headers.get('ETag'),
+                                     response.headers.get('Last-Modified'), response.content)
+            # バイト列のまま渡し、文字コードはmetaタグなどからBeautifulSoup側で判定する
+            # （apparent_encodingは本文全体を文字コード推定にかけるため使わない）
+            return response.content
         except Exception as e:
             logger.error(f"requestsでHTML取得に失敗: {url} - {e}")
             return None
 
+    def _url_exists(self, url: str) -> bool:
+        """
+        HEADリクエストでURLが存在するかを確認（本文はダウンロードしない）
+
+        Args:
+            url: 確認対象のURL
+
+        Returns:
+            404/410が返った場合のみFalse（HEAD非対応や通信エラーは本取得で判断するためTrue）
+        """
+        if self._http_cache is not None:
+            cached = self._http_cache.get(url)
+            if cached is not None and cached[0]:
+                return True
+        try:
+            self._head_rate_limiter.wait(url)
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            return response.status_code not in (404, 410)
+        except Exception as e:
+            logger.debug(f"HEADリクエストに失敗: {url} - {e}")
+            return True
+
     def scrape_with_selenium(self, url: str) -> Optional[BeautifulSoup]:
         """
         Seleniumを使用してHTMLを取得（JavaScriptが必要な場合）
@@ -999,21 +1989,72 @@ class PortfolioScraper:
         Returns:
             BeautifulSoupオブジェクト、失敗時はNone
         """
+        if self._renderer is not None:
+            try:
+                # Seleniumと同様に読み込み完了（画像などは遮断済み）まで待つ
+                self._rate_limiter.wait(url)
+                return self._parse_html(self._renderer.render(url, wait_until='load'))
+            except Exception as e:
+                logger.error(f"PlaywrightでHTML取得に失敗: {url} - {e}")
+                return None
+
         if not self.driver:
             logger.error("Seleniumドライバーが利用できません")
             return None
 
         try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, self.timeout).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)  # ページの読み込みを待つ
-            return BeautifulSoup(self.driver.page_source, 'lxml')
+            self._rate_limiter.wait(url)
+            with self._driver_lock:
+                self.driver.get(url)
+                WebDriverWait(self.driver, self.timeout).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+                # 固定時間待つ代わりに、読み込み完了か会社名の要素が現れた時点で進む
+                try:
+                    WebDriverWait(self.driver, self.timeout).until(EC.any_of(
+                        lambda d: d.execute_script('return document.readyState') == 'complete',
+                        EC.presence_of_element_located((By.CSS_SELECTOR, PORTFOLIO_SELECTOR)),
+                    ))
+                except TimeoutException:
+                    pass
+                page_source = self.driver.page_source
+            return self._parse_html(page_source)
         except Exception as e:
             logger.error(f"SeleniumでHTML取得に失敗: {url} - {e}")
             return None
 
+    def _extract_companies_cached(self, html: bytes, page_url: str) -> Set[str]:
+        """
+        HTMLから会社名を抽出（同じ内容のページはディスクキャッシュから返す）
+
+        Args:
+            html: ページのHTML
+            page_url: ページのURL
+
+        Returns:
+            会社名のセット
+        """
+        if self._page_cache is None:
+            return self.extract_companies_from_page(self._parse_html(html), page_url)
+
+        cache_key = PageResultCache.make_key(html, page_url, self.use_ocr)
+        cached = self._page_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"キャッシュ済みの抽出結果を使用: {page_url}")
+            return set(cached)
+
+        # 画像や詳細ページの取得に一時的に失敗した結果は欠けている可能性があるので保存しない
+        fetch_failures = []
+        companies = self.extract_companies_from_page(self._parse_html(html), page_url, fetch_failures=fetch_failures)
+        if fetch_failures:
+            logger.debug(f"取得に失敗した画像・詳細ページがあるため抽出結果をキャッシュしません: {page_url}")
+            return companies
+        try:
+            self._page_cache.set(cache_key, sorted(companies))
+        except sqlite3.Error as e:
+            logger.debug(f"ページキャッシュへの保存に失敗: {e}")
+        return companies
+
     def scrape_url(self, url: str) -> Dict[str, any]:
         """
         単一URLをスクレイピング（改善版）
@@ -1035,9 +2076,10 @@ class PortfolioScraper:
             'ocr_used': False
         }
 
-        # まずrequestsで試行
-        soup = self.scrape_with_requests(url)
-        if soup:
+        # まずrequestsで試行（ポートフォリオタブ探しはlxmlで直接行い、BeautifulSoupの木は作らない）
+        html = self._fetch_with_requests(url)
+        soup = None
+        if html is not None:
             result['method'] = 'requests'
         else:
             # requestsが失敗した場合、Seleniumで試行
@@ -1049,51 +2091,112 @@ class PortfolioScraper:
                 return result
 
         # ポートフォリオタブを探す
-        portfolio_url = self.find_portfolio_tab(soup, url)
+        if html is not None:
+            portfolio_url = self.find_portfolio_tab_in_html(html, url)
+        else:
+            portfolio_url = self.find_portfolio_tab(soup, url)
         if portfolio_url:
             result['portfolio_url'] = portfolio_url
 
-            # ポートフォリオページをスクレイピング
-            portfolio_soup = self.scrape_with_requests(portfolio_url)
-            if not portfolio_soup:
+            # ポートフォリオページをスクレイピング（現在のページ自体の場合は取得済みのHTMLを使う）
+            if portfolio_url == url and html is not None:
+                portfolio_html = html
+            else:
+                portfolio_html = self._fetch_with_requests(portfolio_url)
+
+            companies = None
+            if portfolio_html is not None:
+                companies = self._extract_companies_cached(portfolio_html, portfolio_url)
+            else:
                 portfolio_soup = self.scrape_with_selenium(portfolio_url)
+                if portfolio_soup:
+                    companies = self.extract_companies_from_page(portfolio_soup, portfolio_url)
 
-            if portfolio_soup:
-                companies = self.extract_companies_from_page(portfolio_soup, portfolio_url)
+            if companies is not None:
                 result['companies'] = list(companies)
                 result['ocr_used'] = self.use_ocr
                 logger.info(f"Portfolioページから {len(companies)} 社の会社名を抽出: {portfolio_url}")
             else:
                 result['error'] = "Portfolioページの取得に失敗しました"
         else:
-            # ポートフォリオタブが見つからない場合、現在のページから会社名を抽出
-            companies = self.extract_companies_from_page(soup, url)
+            # ポートフォリオタブが見つからない場合、現在のページ全体を解析して会社名を抽出
+            if html is not None:
+                companies = self._extract_companies_cached(html, url)
+            else:
+                companies = self.extract_companies_from_page(soup, url)
             result['companies'] = list(companies)
             result['ocr_used'] = self.use_ocr
             logger.info(f"現在のページから {len(companies)} 社の会社名を抽出: {url}")
 
         return result
 
-    def scrape_urls(self, urls: List[str]) -> List[Dict[str, any]]:
+    def scrape_urls(self, urls: List[str], checkpoint_file: Optional[str] = None) -> List[Dict[str, any]]:
         """
         URLリストをスクレイピング
 
         Args:
             urls: スクレイピング対象のURLリスト
+            checkpoint_file: 結果を逐次書き出すJSON Linesファイル（指定すると、
+                既にエラーなく完了しているURLはこのファイルの結果を使い再取得しない。
+                中断後の再開用なので、最後まで完了したら削除する）
 
         Returns:
             スクレイピング結果のリスト
         """
-        results = []
-
-        for i, url in enumerate(urls, 1):
+        completed = {}
+        writer = None
+        if checkpoint_file:
+            completed = {result['url']: result for result in ResultCheckpointWriter.load(checkpoint_file)
+                         if not result.get('error')}
+            if completed:
+                logger.info(f"チェックポイントから {len(completed)} 件の結果を再利用します: {checkpoint_file}")
+            writer = ResultCheckpointWriter(checkpoint_file)
+
+        # 存在しないURLはHEADだけで除外し、本文の取得やSeleniumへのフォールバックを避ける
+        missing = set()
+        if self.head_check:
+            pending = [url for url in dict.fromkeys(urls) if url not in completed]
+            with ThreadPoolExecutor(max_workers=self.max_url_workers) as executor:
+                missing = {url for url, exists in zip(pending, executor.map(self._url_exists, pending))
+                           if not exists}
+            if missing:
+                logger.info(f"HEADリクエストで {len(missing)} 件のURLが存在しないため除外します")
+
+        def scrape_one(index_url: Tuple[int, str]) -> Dict[str, any]:
+            i, url = index_url
+            if url in completed:
+                return completed[url]
+            if url in missing:
+                result = {'url': url, 'portfolio_url': None, 'companies': [],
+                          'error': "URLが存在しません（404/410）", 'method': None, 'ocr_used': False}
+                if writer is not None:
+                    writer.put(result)
+                return result
+            # 同じホストへのアクセス間隔は、各取得処理の直前でレートリミッターが空ける
             logger.info(f"進捗: {i}/{len(urls)} - {url}")
-
             result = self.scrape_url(url)
-            results.append(result)
+            # 書き込みは専用スレッドに任せ、ここではキューに入れるだけ
+            if writer is not None:
+                writer.put(result)
+            return result
+
+        # 各URLの処理はほぼI/O待ちなので、サイト単位でスレッドプールに分散する
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_url_workers) as executor:
+                results = list(executor.map(scrape_one, enumerate(urls, 1)))
+        finally:
+            if writer is not None:
+                writer.close()
+
+        # 最後まで完了した場合はチェックポイントを残さない（次回の実行で古い結果を再利用しないため）
+        if checkpoint_file:
+            try:
+                os.remove(checkpoint_file)
+            except FileNotFoundError:
+                pass
 
-            # サーバーに負荷をかけないよう少し待機
-            time.sleep(2)
+        # 解析済みのページは以降使わないので解放する
+        self._clear_parse_cache()
 
         return results
 
@@ -1121,39 +2224,79 @@ class PortfolioScraper:
             output_file: 出力ファイル名
         """
         try:
-            # フラット化されたデータを作成
-            flat_data = []
-            for result in results:
-                if result['companies']:
-                    for company in result['companies']:
-                        flat_data.append({
-                            'url': result['url'],
-                            'portfolio_url': result['portfolio_url'],
-                            'company_name': company,
-                            'method': result['method'],
-                            'ocr_used': result['ocr_used'],
-                            'error': result['error']
-                        })
-                else:
-                    flat_data.append({
-                        'url': result['url'],
-                        'portfolio_url': result['portfolio_url'],
-                        'company_name': '',
-                        'method': result['method'],
-                        'ocr_used': result['ocr_used'],
-                        'error': result['error']
-                    })
-
-            df = pd.DataFrame(flat_data)
-            df.to_csv(output_file, index=False, encoding='utf-8-sig')
+            # 1行ずつ書き出し、中間のリストやDataFrameを作らない
+            with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=RESULT_FIELDNAMES, lineterminator=os.linesep)
+                writer.writeheader()
+                writer.writerows(self._iter_result_rows(results))
             logger.info(f"結果をCSVに保存しました: {output_file}")
         except Exception as e:
             logger.error(f"CSV保存に失敗しました: {e}")
 
+    def save_results_parquet(self, results: List[Dict[str, any]], output_file: str = 'portfolio_results.parquet'):
+        """
+        結果をParquetファイルに保存（分析用、pyarrowが必要）
+
+        文字列は列ごとに型を固定し、値の種類が少ない列（method）は辞書エンコードする。
+
+        Args:
+            results: スクレイピング結果のリスト
+            output_file: 出力ファイル名
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.error("pyarrowが利用できないためParquetに保存できません（pip install pyarrow）")
+            return
+
+        try:
+            columns = {name: [] for name in RESULT_FIELDNAMES}
+            for row in self._iter_result_rows(results):
+                for name in RESULT_FIELDNAMES:
+                    columns[name].append(row[name])
+            schema = pa.schema([
+                ('url', pa.string()),
+                ('portfolio_url', pa.string()),
+                ('company_name', pa.string()),
+                ('method', pa.dictionary(pa.int8(), pa.string())),
+                ('ocr_used', pa.bool_()),
+                ('error', pa.string()),
+            ])
+            table = pa.Table.from_pydict(columns, schema=schema)
+            pq.write_table(table, output_file, compression='zstd')
+            logger.info(f"結果をParquetに保存しました: {output_file}")
+        except Exception as e:
+            logger.error(f"Parquet保存に失敗しました: {e}")
+
+    @staticmethod
+    def _iter_result_rows(results: List[Dict[str, any]]):
+        """結果を1社1行の辞書として順に返す（会社名がない結果も1行にする）"""
+        for result in results:
+            for company in result['companies'] or ['']:
+                yield {
+                    'url': result['url'],
+                    'portfolio_url': result['portfolio_url'],
+                    'company_name': company,
+                    'method': result['method'],
+                    'ocr_used': result['ocr_used'],
+                    'error': result['error']
+                }
+
     def close(self):
         """リソースのクリーンアップ"""
         if self.driver:
             self.driver.quit()
+        if self._renderer is not None:
+            self._renderer.close()
+        if self._ocr_cache is not None:
+            self._ocr_cache.close()
+        if self._page_cache is not None:
+            self._page_cache.close()
+        if self._http_cache is not None:
+            self._http_cache.close()
+        if self._filter_executor is not None:
+            self._filter_executor.shutdown()
         self.session.close()
         logger.info("リソースのクリーンアップが完了しました")
 
@@ -1211,7 +2354,7 @@ def main():
 
     try:
         # スクレイピング実行
-        results = scraper.scrape_urls(urls)
+        results = scraper.scrape_urls(urls, checkpoint_file='portfolio_results.partial.jsonl')
 
         # 結果の保存
         scraper.save_results(results, 'portfolio_results.json')
@@ -8,19 +8,45 @@ Research Mapから研究者情報と競争的研究課題を取得する統合
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import io
 import json
 import time
 import pandas as pd
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional, Union
+import lxml.html
+from lxml import etree
+from lxml.etree import ParserError
+from typing import List, Dict, Any, Optional, Tuple, Union
 import logging
 import re
+import sqlite3
+import threading
 from urllib.parse import urljoin, urlparse
 import random
 import argparse
+import sys
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from functools import lru_cache
+
+# 高速なJSONシリアライザ（オプション）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 行を逐次書き出すExcelライター（オプション、なければpandas + openpyxl）
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
 
 # =============================================================================
 # 定数と設定
@@ -33,6 +59,15 @@ class ScrapingConfig:
     REQUEST_DELAY_MIN = 1
     REQUEST_DELAY_MAX = 3
     TIMEOUT = 30
+    # これを超える応答は読み込み途中で打ち切る（壊れたページや巨大なページでメモリを使い切らないため）
+    MAX_RESPONSE_BYTES = 20 * 1024 * 1024
+    RESPONSE_CHUNK_SIZE = 64 * 1024
+    # 研究者ごとの取得を同時に実行する数
+    MAX_WORKERS = 8
+
+    # 取得したページのキャッシュ（同じURLは期限内なら再取得しない）
+    CACHE_PATH = 'researchmap_cache.sqlite3'
+    CACHE_EXPIRE_SECONDS = 7 * 24 * 60 * 60
 
     # ヘッダー設定
     HEADERS = {
@@ -68,11 +103,56 @@ class CompetitiveFundingPatterns:
         '新エネルギーベンチャー技術革新事業'
     ]
 
+    # 判定用（クラス定義時に1回だけ構築する）
+    # 鉄鋼環境基金は機関名としては抽出するが、機関名だけでは競争的資金と判定しない
+    COMPETITIVE_INSTITUTION_SET = frozenset(COMPETITIVE_INSTITUTIONS) - {'鉄鋼環境基金'}
+    # いずれかのキーワードを含むかを、キーワードごとに走査せず1回の走査で判定する
+    COMPETITIVE_PROJECT_TYPE_RE = re.compile('|'.join(map(re.escape, COMPETITIVE_PROJECT_TYPES)))
+    COMPETITIVE_INDICATOR_RE = re.compile('|'.join(map(re.escape, COMPETITIVE_INDICATORS)))
+
+def _has_class_xpath(class_name: str) -> str:
+    """class属性に指定トークンを含むかを判定するXPath述語"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+class ProjectListSelectors:
+    """研究課題一覧ページのXPath・パターン（モジュール読み込み時に1回だけコンパイルする）"""
+    ITEM_CLASS = 'list-group-item'
+    AUTHOR_CLASS = 'rm-cv-list-author'
+    TITLE = etree.XPath(f'(.//a[{_has_class_xpath("rm-cv-list-title")}])[1]')
+    AUTHOR = etree.XPath(f'(.//div[{_has_class_xpath(AUTHOR_CLASS)}])[1]')
+    # iterparseの要素はlxml.htmlの要素ではない（text_contentがない）ため、XPathで文字列化する
+    # （smart_strings=Falseで元要素への参照を持つ文字列オブジェクトを作らない）
+    TEXT = etree.XPath('string()', smart_strings=False)
+    # 資金情報の行から除外する研究者名（いずれかを含む行を1回の走査で判定する）
+    AUTHOR_NAME_RE = re.compile('|'.join(map(re.escape, [
+        '兼松', '平井', '小川', '生貝', '田路', '小林', '岡田', '内海', '三浦', '加藤', '鈴木',
+        '秋元', '岩田', '矢島', '中平', 'Colligon', '枡田', '亜希子', '玉内'
+    ])))
+
+    @classmethod
+    def text(cls, element: etree._Element) -> str:
+        """要素配下のテキストを連結して前後の空白を除去"""
+        return cls.TEXT(element).strip()
+
+class ResearcherCardXPaths:
+    """研究者検索結果カードのXPath（lxmlの木で直接評価し、BeautifulSoupの木は作らない）"""
+    HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+    CARD = etree.XPath(f'(.//div[{_has_class_xpath("rm-cv-card-outer")}])[1]')
+    NAME_LINK = etree.XPath(f'(.//div[{_has_class_xpath("rm-cv-card-name")}])[1]//a')
+    ENGLISH_NAME = etree.XPath(f'(.//div[{_has_class_xpath("rm-cv-card-name-en")}])[1]')
+    AFFILIATION = etree.XPath(f'(.//div[{_has_class_xpath("rm-cv-card-name-affiliation")}])[1]')
+    POSITION = etree.XPath(f'(.//div[{_has_class_xpath("rm-cv-card-name-section")}])[1]')
+    KANA = etree.XPath(f'(.//div[{_has_class_xpath("rm-cv-card-kana")}])[1]')
+
 # =============================================================================
 # データクラス
 # =============================================================================
 
-@dataclass
+# Python 3.10以降は__slots__付きで生成し、インスタンスごとの__dict__を持たない
+# （複数値の項目は空タプルを既定値とし、インスタンスごとに空リストを作らない。値は丸ごと代入する）
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_OPTIONS)
 class ResearcherInfo:
     """研究者情報データクラス"""
     name: str = ""
@@ -85,19 +165,11 @@ class ResearcherInfo:
     orcid_id: str = ""
     jglobal_id: str = ""
     researchmap_member_id: str = ""
-    research_keywords: List[str] = None
-    research_areas: List[str] = None
-    all_affiliations: List[str] = None
-
-    def __post_init__(self):
-        if self.research_keywords is None:
-            self.research_keywords = []
-        if self.research_areas is None:
-            self.research_areas = []
-        if self.all_affiliations is None:
-            self.all_affiliations = []
-
-@dataclass
+    research_keywords: Tuple[str, ...] = ()
+    research_areas: Tuple[str, ...] = ()
+    all_affiliations: Tuple[str, ...] = ()
+
+@dataclass(**DATACLASS_OPTIONS)
 class ProjectInfo:
     """研究課題情報データクラス"""
     title: str = ""
@@ -112,14 +184,8 @@ class ProjectInfo:
     description: str = ""
     budget: str = ""
     research_category: str = ""
-    keywords: List[str] = None
-    organizations: List[str] = None
-
-    def __post_init__(self):
-        if self.keywords is None:
-            self.keywords = []
-        if self.organizations is None:
-            self.organizations = []
+    keywords: Tuple[str, ...] = ()
+    organizations: Tuple[str, ...] = ()
 
 # =============================================================================
 # ログ設定
@@ -143,6 +209,19 @@ logger = setup_logging()
 # ユーティリティクラス
 # =============================================================================
 
+class JSONHelper:
+    """JSON保存ヘルパークラス"""
+
+    @staticmethod
+    def dump(data: Any, output_file: str):
+        """データをインデント付きのUTF-8 JSONとして保存（orjsonがあれば使用）"""
+        if ORJSON_AVAILABLE:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
 class URLHelper:
     """URL操作ヘルパークラス"""
 
@@ -164,129 +243,252 @@ class URLHelper:
     @staticmethod
     def ensure_absolute_url(url: str, base_url: str = ScrapingConfig.BASE_URL) -> str:
         """絶対URLを保証"""
-        if not url.startswith('http'):
-            return urljoin(base_url, url)
-        return url
+        if url.startswith('http'):
+            return url
+        # researchmapのリンクはルートからの絶対パスなので、課題ごとにurljoinで解析せず連結する
+        if base_url == ScrapingConfig.BASE_URL and url.startswith('/') and not url.startswith('//') and '/.' not in url:
+            return base_url + url
+        return urljoin(base_url, url)
+
+class ResponseCache:
+    """URLをキーにした取得済みページのディスクキャッシュ（SQLite、スレッドセーフ）"""
+
+    def __init__(self, path: str = ScrapingConfig.CACHE_PATH,
+                 expire_seconds: float = ScrapingConfig.CACHE_EXPIRE_SECONDS):
+        self.expire_seconds = expire_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, content BLOB, encoding TEXT, content_type TEXT, fetched REAL)'
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """期限内のキャッシュがあればレスポンスとして返す"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT content, encoding, content_type, fetched FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None or time.time() - row[3] >= self.expire_seconds:
+            return None
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response._content = row[0]
+        response.encoding = row[1]
+        if row[2]:
+            response.headers['Content-Type'] = row[2]
+        return response
+
+    def set(self, url: str, response: requests.Response):
+        """取得に成功したレスポンスを保存（リダイレクトされた場合も要求したURLをキーにする）"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (url, content, encoding, content_type, fetched) VALUES (?, ?, ?, ?, ?)',
+                (url, response.content, response.encoding,
+                 response.headers.get('Content-Type'), time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        """キャッシュを閉じる"""
+        with self._lock:
+            self._conn.close()
 
 class DataExtractor:
     """データ抽出ヘルパークラス"""
 
+    # 抽出パターン（不変のタプル。使われない実行ではコンパイルしないよう、初回使用時に_compiledで1回だけコンパイルする）
+    # 先頭が[^,]*?などで始まるパターンは、区切り文字の直後（または先頭）でしか一致が始まらないため
+    # 後読みで開始位置を限定する（区切りのない長いテキストで全開始位置から走査し直す二乗の時間を避ける。結果は同じ）
+    # 各リストは優先順に1つずつ検索する。1つの選択（|）にまとめると最も左の一致が優先されて結果が変わるうえ、
+    # 先頭リテラルによる高速な走査が効かなくなり、CPythonのreでは逐次検索より遅くなる
+    FUNDING_PATTERNS = (
+        r'(日本学術振興会\s+科学研究費補助金[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(JST[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(文部科学省[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(厚生労働省[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(経済産業省[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(基盤研究[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(挑戦的研究[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(新学術領域[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(特別研究員[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(若手研究[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(萌芽研究[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(特別推進研究[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?研究費[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?助成金[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?補助金[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?事業[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?プロジェクト[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?基金[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?財団[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?協会[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?機構[^,]*?)(?=\s+\d{4}年|\s*$)',
+        r'(?:^|(?<=,))([^,]*?センター[^,]*?)(?=\s+\d{4}年|\s*$)'
+    )
+
+    PERIOD_PATTERNS = (
+        r'(\d{4}年\d{1,2}月\s*-\s*\d{4}年\d{1,2}月)',
+        r'(\d{4}年\d{1,2}月\s*～\s*\d{4}年\d{1,2}月)',
+        r'(\d{4}年\d{1,2}月\s*から\s*\d{4}年\d{1,2}月)',
+        r'(\d{4}\.\d{1,2}\s*-\s*\d{4}\.\d{1,2})',
+        r'(\d{4}-\d{4})',
+        r'(FY\d{4}-FY\d{4})',
+        r'(平成\d{1,2}年度\s*-\s*平成\d{1,2}年度)',
+        r'(令和\d{1,2}年度\s*-\s*令和\d{1,2}年度)',
+        r'(\d{4}年度\s*-\s*\d{4}年度)',
+        r'(\d{4}年度から\d{4}年度)',
+        r'(\d{4}年\s*-\s*\d{4}年)'
+    )
+
+    RESEARCHER_PATTERNS = (
+        r'研究代表者[：:]\s*([^,\n]+)',
+        r'研究責任者[：:]\s*([^,\n]+)',
+        r'代表者[：:]\s*([^,\n]+)',
+        r'責任者[：:]\s*([^,\n]+)',
+        r'(?:^|(?<=[,\n]))([^,\n]+(?:教授|准教授|助教|研究員|博士|Ph\.D)[^,\n]*)',
+        r'(?:^|(?<=[,\n]))([^,\n]+(?:,\s*[^,\n]+)*?)(?:\s*$)'
+    )
+
+    BUDGET_PATTERNS = (
+        r'予算[：:]\s*([^,\n]+)',
+        r'助成金額[：:]\s*([^,\n]+)',
+        r'補助金額[：:]\s*([^,\n]+)',
+        r'([0-9,]+万円)',
+        r'([0-9,]+千円)',
+        r'([0-9,]+円)',
+        r'([0-9,]+ドル)',
+        r'([0-9,]+ユーロ)'
+    )
+
+    CATEGORY_PATTERNS = (
+        r'研究種目[：:]\s*([^,\n]+)',
+        r'カテゴリ[：:]\s*([^,\n]+)',
+        r'分野[：:]\s*([^,\n]+)',
+        r'領域[：:]\s*([^,\n]+)',
+        r'(基盤研究[ABC])',
+        r'(若手研究[ABC])',
+        r'(萌芽研究[ABC])',
+        r'(挑戦的萌芽研究)',
+        r'(特別推進研究)',
+        r'(新学術領域研究)'
+    )
+
+    KEYWORD_PATTERNS = (
+        r'キーワード[：:]\s*([^,\n]+)',
+        r'研究キーワード[：:]\s*([^,\n]+)',
+        r'技術キーワード[：:]\s*([^,\n]+)'
+    )
+
+    ORGANIZATION_PATTERNS = (
+        r'研究機関[：:]\s*([^,\n]+)',
+        r'実施機関[：:]\s*([^,\n]+)',
+        r'協力機関[：:]\s*([^,\n]+)',
+        r'連携機関[：:]\s*([^,\n]+)'
+    )
+    # 組織名のキーワード。キーワードを含む区切り（カンマ・改行）単位の文字列全体を組織名とする
+    # （正規表現 ([^,\n]*?大学[^,\n]*) のfindallと同じ結果を、分割と部分文字列検索だけで求める）
+    ORGANIZATION_KEYWORDS = ('大学', '研究所', 'センター', '財団', '協会')
+
+    # 各パターンリストが一致するために必要な文字列（いずれも含まないテキストは正規表現を実行せずに空を返す）
+    FUNDING_LITERALS = (
+        '日本学術振興会', 'JST', '文部科学省', '厚生労働省', '経済産業省', '基盤研究', '挑戦的研究',
+        '新学術領域', '特別研究員', '若手研究', '萌芽研究', '特別推進研究', '研究費', '助成金', '補助金',
+        '事業', 'プロジェクト', '基金', '財団', '協会', '機構', 'センター'
+    )
+    BUDGET_LITERALS = ('予算', '助成金額', '補助金額', '円', 'ドル', 'ユーロ')
+    CATEGORY_LITERALS = ('研究種目', 'カテゴリ', '分野', '領域', '基盤研究', '若手研究', '萌芽研究', '特別推進研究')
+    KEYWORD_LITERAL = 'キーワード'
+    # 期間のパターンはすべて数字を含む
+    DIGIT_PATTERN = re.compile(r'\d')
+
+    # 課題の説明文など短いテキストの抽出結果をキャッシュする件数（共同研究者間で同じ説明文が繰り返されるため）
+    # （ページ全体のテキストを受け取るextract_keywords/extract_organizationsは毎回異なり大きいのでキャッシュしない）
+    CACHE_SIZE = 4096
+
+    YEAR_PATTERN = re.compile(r'\d{4}年')
+    TOTAL_COUNT_PATTERN = re.compile(r'総件数\s*(\d+)')
+    # カンマ（と空白）の直後ではない改行。末尾フォールバックはこれをまたいで一致できない
+    LINE_BREAK_PATTERN = re.compile(r'(?:^|[^,\s])\s*\n')
+
     @staticmethod
+    @lru_cache(maxsize=None)
+    def _compiled(patterns: Tuple[str, ...]) -> tuple:
+        """パターン文字列のタプルを初回使用時に1回だけコンパイルする"""
+        return tuple(re.compile(p) for p in patterns)
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
     def extract_funding_system(text: str) -> str:
         """資金システム情報を抽出"""
-        funding_patterns = [
-            r'(日本学術振興会\s+科学研究費補助金[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(JST[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(文部科学省[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(厚生労働省[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(経済産業省[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(基盤研究[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(挑戦的研究[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(新学術領域[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(特別研究員[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(若手研究[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(萌芽研究[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'(特別推進研究[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?研究費[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?助成金[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?補助金[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?事業[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?プロジェクト[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?基金[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?財団[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?協会[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?機構[^,]*?)(?:\s+\d{4}年|\s*$)',
-            r'([^,]*?センター[^,]*?)(?:\s+\d{4}年|\s*$)'
-        ]
-
-        for pattern in funding_patterns:
-            match = re.search(pattern, text)
+        if not any(literal in text for literal in DataExtractor.FUNDING_LITERALS):
+            return ""
+        for pattern in DataExtractor._compiled(DataExtractor.FUNDING_PATTERNS):
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return ""
 
     @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
     def extract_period(text: str) -> str:
         """期間情報を抽出"""
-        period_patterns = [
-            r'(\d{4}年\d{1,2}月\s*-\s*\d{4}年\d{1,2}月)',
-            r'(\d{4}年\d{1,2}月\s*～\s*\d{4}年\d{1,2}月)',
-            r'(\d{4}年\d{1,2}月\s*から\s*\d{4}年\d{1,2}月)',
-            r'(\d{4}\.\d{1,2}\s*-\s*\d{4}\.\d{1,2})',
-            r'(\d{4}-\d{4})',
-            r'(FY\d{4}-FY\d{4})',
-            r'(平成\d{1,2}年度\s*-\s*平成\d{1,2}年度)',
-            r'(令和\d{1,2}年度\s*-\s*令和\d{1,2}年度)',
-            r'(\d{4}年度\s*-\s*\d{4}年度)',
-            r'(\d{4}年度から\d{4}年度)',
-            r'(\d{4}年\d{1,2}月\s*-\s*\d{4}年\d{1,2}月)',
-            r'(\d{4}年\s*-\s*\d{4}年)'
-        ]
-
-        for pattern in period_patterns:
-            match = re.search(pattern, text)
+        if not DataExtractor.DIGIT_PATTERN.search(text):
+            return ""
+        for pattern in DataExtractor._compiled(DataExtractor.PERIOD_PATTERNS):
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return ""
 
     @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
     def extract_researchers(text: str) -> str:
         """研究者情報を抽出"""
-        researcher_patterns = [
-            r'研究代表者[：:]\s*([^,\n]+)',
-            r'研究責任者[：:]\s*([^,\n]+)',
-            r'代表者[：:]\s*([^,\n]+)',
-            r'責任者[：:]\s*([^,\n]+)',
-            r'([^,\n]+(?:教授|准教授|助教|研究員|博士|Ph\.D)[^,\n]*)',
-            r'([^,\n]+(?:,\s*[^,\n]+)*?)(?:\s*$)'
-        ]
-
-        for pattern in researcher_patterns:
-            match = re.search(pattern, text)
+        patterns = DataExtractor._compiled(DataExtractor.RESEARCHER_PATTERNS)
+        for index, pattern in enumerate(patterns):
+            # 末尾フォールバックは最後の改行より前から試すと行ごとに末尾まで走査し直すので、一致し得る位置から探す
+            pos = DataExtractor._fallback_start(text) if index == len(patterns) - 1 else 0
+            match = pattern.search(text, pos)
             if match:
                 researchers_text = match.group(1).strip()
-                if researchers_text and not re.search(r'\d{4}年', researchers_text) and len(researchers_text) > 2:
+                if researchers_text and not DataExtractor.YEAR_PATTERN.search(researchers_text) and len(researchers_text) > 2:
                     return researchers_text
         return ""
 
     @staticmethod
+    def _fallback_start(text: str) -> int:
+        """末尾フォールバックが一致し得る最初の位置（末尾の空白を除き、カンマで終わらない最後の改行の直後）"""
+        start = 0
+        if '\n' not in text:
+            return start
+        for match in DataExtractor.LINE_BREAK_PATTERN.finditer(text, 0, len(text.rstrip())):
+            start = match.end()
+        return start
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
     def extract_budget(text: str) -> str:
         """予算情報を抽出"""
-        budget_patterns = [
-            r'予算[：:]\s*([^,\n]+)',
-            r'助成金額[：:]\s*([^,\n]+)',
-            r'補助金額[：:]\s*([^,\n]+)',
-            r'([0-9,]+万円)',
-            r'([0-9,]+千円)',
-            r'([0-9,]+円)',
-            r'([0-9,]+ドル)',
-            r'([0-9,]+ユーロ)'
-        ]
-
-        for pattern in budget_patterns:
-            match = re.search(pattern, text)
+        if not any(literal in text for literal in DataExtractor.BUDGET_LITERALS):
+            return ""
+        for pattern in DataExtractor._compiled(DataExtractor.BUDGET_PATTERNS):
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return ""
 
     @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
     def extract_research_category(text: str) -> str:
         """研究種目・カテゴリを抽出"""
-        category_patterns = [
-            r'研究種目[：:]\s*([^,\n]+)',
-            r'カテゴリ[：:]\s*([^,\n]+)',
-            r'分野[：:]\s*([^,\n]+)',
-            r'領域[：:]\s*([^,\n]+)',
-            r'(基盤研究[ABC])',
-            r'(若手研究[ABC])',
-            r'(萌芽研究[ABC])',
-            r'(挑戦的萌芽研究)',
-            r'(特別推進研究)',
-            r'(新学術領域研究)'
-        ]
-
-        for pattern in category_patterns:
-            match = re.search(pattern, text)
+        if not any(literal in text for literal in DataExtractor.CATEGORY_LITERALS):
+            return ""
+        for pattern in DataExtractor._compiled(DataExtractor.CATEGORY_PATTERNS):
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return ""
@@ -295,40 +497,42 @@ class DataExtractor:
     def extract_keywords(text: str) -> List[str]:
         """キーワードを抽出"""
         keywords = []
-        keyword_patterns = [
-            r'キーワード[：:]\s*([^,\n]+)',
-            r'研究キーワード[：:]\s*([^,\n]+)',
-            r'技術キーワード[：:]\s*([^,\n]+)'
-        ]
+        if DataExtractor.KEYWORD_LITERAL not in text:
+            return keywords
 
-        for pattern in keyword_patterns:
-            match = re.search(pattern, text)
+        for pattern in DataExtractor._compiled(DataExtractor.KEYWORD_PATTERNS):
+            match = pattern.search(text)
             if match:
                 keywords_text = match.group(1).strip()
-                keywords.extend([kw.strip() for kw in keywords_text.split(',') if kw.strip()])
+                # 各キーワードのstripは1回だけにし、空の要素はfilterで除く
+                keywords.extend(filter(None, map(str.strip, keywords_text.split(','))))
         return keywords
 
     @staticmethod
     def extract_organizations(text: str) -> List[str]:
         """研究機関・組織を抽出"""
         organizations = []
-        org_patterns = [
-            r'研究機関[：:]\s*([^,\n]+)',
-            r'実施機関[：:]\s*([^,\n]+)',
-            r'協力機関[：:]\s*([^,\n]+)',
-            r'連携機関[：:]\s*([^,\n]+)',
-            r'([^,\n]*?大学[^,\n]*)',
-            r'([^,\n]*?研究所[^,\n]*)',
-            r'([^,\n]*?センター[^,\n]*)',
-            r'([^,\n]*?財団[^,\n]*)',
-            r'([^,\n]*?協会[^,\n]*)'
-        ]
-
-        for pattern in org_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if match.strip() and match.strip() not in organizations:
-                    organizations.append(match.strip())
+        # 重複判定はリストの線形探索ではなく集合で行う
+        seen = set()
+
+        for pattern in DataExtractor._compiled(DataExtractor.ORGANIZATION_PATTERNS):
+            for match in pattern.findall(text):
+                organization = match.strip()
+                if organization and organization not in seen:
+                    seen.add(organization)
+                    organizations.append(organization)
+
+        # キーワードを1つも含まないテキストは分割しない
+        keywords = [kw for kw in DataExtractor.ORGANIZATION_KEYWORDS if kw in text]
+        if keywords:
+            segments = text.replace('\n', ',').split(',')
+            for keyword in keywords:
+                for segment in segments:
+                    if keyword in segment:
+                        organization = segment.strip()
+                        if organization not in seen:
+                            seen.add(organization)
+                            organizations.append(organization)
         return organizations
 
 # =============================================================================
@@ -341,35 +545,87 @@ class ResearchMapIntegratedScraper:
     包括的な研究者データ取得機能を含む
     """
 
-    def __init__(self):
-        """Research Map Integrated Scraperの初期化"""
+    def __init__(self, max_workers: int = ScrapingConfig.MAX_WORKERS,
+                 cache_path: Optional[str] = ScrapingConfig.CACHE_PATH):
+        """
+        Research Map Integrated Scraperの初期化
+
+        Args:
+            max_workers: 研究者ごとの詳細情報・研究課題の取得を同時に実行する数
+            cache_path: 取得したページのキャッシュファイル（Noneでキャッシュしない）
+        """
+        self.max_workers = max_workers
+        self.cache = ResponseCache(cache_path) if cache_path else None
         self.session = requests.Session()
         self.session.headers.update(ScrapingConfig.HEADERS)
+        # 並行取得でもresearchmap.jpへの接続（TCP/TLS）を使い回せるようにプールを広げ、
+        # 一時的なエラーはバックオフ付きで再試行する
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=32, pool_maxsize=max(32, max_workers))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         logger.info("ResearchMap Integrated Scraper initialized")
 
     def _make_request(self, url: str) -> requests.Response:
         """HTTPリクエストを実行（エラーハンドリング付き）"""
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                # キャッシュから返す場合はサーバーにアクセスしないので待機しない
+                return cached
+
         try:
-            response = self.session.get(url, timeout=ScrapingConfig.TIMEOUT)
-            response.raise_for_status()
+            response = self.session.get(url, timeout=ScrapingConfig.TIMEOUT, stream=True)
+            try:
+                response.raise_for_status()
+                response._content = self._read_body(response, url)
+            finally:
+                # 読み切った場合は接続をプールに戻し、打ち切った場合は破棄する
+                response.close()
+            if self.cache is not None:
+                self.cache.set(url, response)
+            # サーバーへの負荷軽減の待機はここに一本化する（ランダムな間隔でワーカー同士の同期を避ける）
             time.sleep(random.uniform(ScrapingConfig.REQUEST_DELAY_MIN, ScrapingConfig.REQUEST_DELAY_MAX))
             return response
         except requests.RequestException as e:
             logger.error(f"リクエストエラー {url}: {e}")
             raise
 
+    @staticmethod
+    def _read_body(response: requests.Response, url: str) -> bytes:
+        """応答本文をチャンク単位で読み込む（上限を超えたら打ち切る）"""
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > ScrapingConfig.MAX_RESPONSE_BYTES:
+            raise requests.RequestException(f"応答サイズが上限を超えています: {content_length} bytes")
+
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=ScrapingConfig.RESPONSE_CHUNK_SIZE):
+            size += len(chunk)
+            if size > ScrapingConfig.MAX_RESPONSE_BYTES:
+                raise requests.RequestException(f"応答サイズが上限を超えています: {url}")
+            chunks.append(chunk)
+        return b''.join(chunks)
+
     def get_total_pages(self, search_url: str) -> int:
         """検索結果の総ページ数を取得"""
         try:
             logger.info(f"総ページ数を取得中: {search_url}")
             response = self._make_request(search_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             # 総件数から計算
             total_count_elements = soup.find_all(string=lambda text: text and '総件数' in text)
             if total_count_elements:
                 for element in total_count_elements:
-                    match = re.search(r'総件数\s*(\d+)', element)
+                    match = DataExtractor.TOTAL_COUNT_PATTERN.search(element)
                     if match:
                         total_count = int(match.group(1))
                         total_pages = (total_count + ScrapingConfig.ITEMS_PER_PAGE - 1) // ScrapingConfig.ITEMS_PER_PAGE
@@ -401,46 +657,38 @@ class ResearchMapIntegratedScraper:
     def extract_researchers_from_page(self, html_content: str) -> List[Dict[str, Any]]:
         """ページから研究者情報を抽出"""
         researchers = []
-        soup = BeautifulSoup(html_content, 'html.parser')
-        researcher_items = soup.find_all('li')
+        try:
+            tree = lxml.html.document_fromstring(html_content, parser=ResearcherCardXPaths.HTML_PARSER)
+        except ParserError:
+            # 空のレスポンス
+            logger.info("0人の研究者情報を抽出しました")
+            return researchers
 
-        for item in researcher_items:
+        for item in tree.iter('li'):
             try:
-                card_outer = item.find('div', class_='rm-cv-card-outer')
+                card_outer = ResearcherCardXPaths.CARD(item)
                 if not card_outer:
                     continue
+                card_outer = card_outer[0]
 
                 researcher_info = {}
 
                 # 名前を取得
-                name_element = card_outer.find('div', class_='rm-cv-card-name')
-                if name_element:
-                    name_link = name_element.find('a')
-                    if name_link:
-                        researcher_info['name'] = name_link.get_text().strip()
-                        researcher_url = name_link['href']
-                        researcher_info['researcher_url'] = URLHelper.ensure_absolute_url(researcher_url)
-                        researcher_info['researcher_id'] = URLHelper.extract_researcher_id(researcher_info['researcher_url'])
-
-                # 英語名を取得
-                english_name_element = card_outer.find('div', class_='rm-cv-card-name-en')
-                if english_name_element:
-                    researcher_info['english_name'] = english_name_element.get_text().strip()
-
-                # 所属を取得
-                affiliation_element = card_outer.find('div', class_='rm-cv-card-name-affiliation')
-                if affiliation_element:
-                    researcher_info['affiliation'] = affiliation_element.get_text().strip()
-
-                # 職名を取得
-                position_element = card_outer.find('div', class_='rm-cv-card-name-section')
-                if position_element:
-                    researcher_info['position'] = position_element.get_text().strip()
-
-                # カナ名を取得
-                kana_element = card_outer.find('div', class_='rm-cv-card-kana')
-                if kana_element:
-                    researcher_info['kana_name'] = kana_element.get_text().strip()
+                name_link = ResearcherCardXPaths.NAME_LINK(card_outer)
+                if name_link:
+                    researcher_info['name'] = name_link[0].text_content().strip()
+                    researcher_url = name_link[0].attrib['href']
+                    researcher_info['researcher_url'] = URLHelper.ensure_absolute_url(researcher_url)
+                    researcher_info['researcher_id'] = URLHelper.extract_researcher_id(researcher_info['researcher_url'])
+
+                # 英語名・所属・職名・カナ名を取得
+                for key, xpath in (('english_name', ResearcherCardXPaths.ENGLISH_NAME),
+                                   ('affiliation', ResearcherCardXPaths.AFFILIATION),
+                                   ('position', ResearcherCardXPaths.POSITION),
+                                   ('kana_name', ResearcherCardXPaths.KANA)):
+                    element = xpath(card_outer)
+                    if element:
+                        researcher_info[key] = element[0].text_content().strip()
 
                 if researcher_info and researcher_info.get('name'):
                     researchers.append(researcher_info)
@@ -459,7 +707,7 @@ class ResearchMapIntegratedScraper:
 
         logger.info(f"全{total_pages}ページから研究者情報を取得開始")
 
-        for page in range(1, total_pages + 1):
+        def fetch_page(page):
             try:
                 if page == 1:
                     page_url = base_search_url
@@ -471,13 +719,19 @@ class ResearchMapIntegratedScraper:
 
                 response = self._make_request(page_url)
                 page_researchers = self.extract_researchers_from_page(response.content)
-                all_researchers.extend(page_researchers)
 
                 logger.info(f"ページ {page} で {len(page_researchers)} 人の研究者を取得")
+                return page_researchers
 
             except Exception as e:
                 logger.error(f"ページ {page} の処理エラー: {e}")
-                continue
+                return []
+
+        # 検索結果ページの取得も通信待ちが大半なので、研究者単位と同じくスレッドで並行して実行する
+        # （executor.mapはページ順に結果を返すので、研究者の並び順は逐次取得と変わらない）
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for page_researchers in executor.map(fetch_page, range(1, total_pages + 1)):
+                all_researchers.extend(page_researchers)
 
         logger.info(f"全ページ処理完了。総計 {len(all_researchers)} 人の研究者を取得")
         return all_researchers
@@ -487,7 +741,7 @@ class ResearchMapIntegratedScraper:
         try:
             logger.info(f"研究者詳細情報を取得中: {researcher_url}")
             response = self._make_request(researcher_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             detailed_info = {}
 
             # ORCID iDを取得
@@ -662,60 +916,71 @@ class ResearchMapIntegratedScraper:
             if response.status_code != 200:
                 return []
 
-            soup = BeautifulSoup(response.content, 'html.parser')
             projects = []
 
-            # 研究課題リストを探す（正しいHTML構造）
-            project_items = soup.find_all('li', class_='list-group-item')
-
-            for item in project_items:
-                project = {}
-
-                # タイトルを抽出
-                title_link = item.find('a', class_='rm-cv-list-title')
-                if title_link:
-                    project['title'] = title_link.get_text().strip()
-                    project['project_url'] = URLHelper.ensure_absolute_url(title_link.get('href'))
-
-                # 資金システムと期間を抽出
-                divs = item.find_all('div')
-                for div in divs:
-                    # タイトルリンクを含まないdivを探す
-                    if not div.find('a') and (not div.get('class') or 'rm-cv-list-author' not in div.get('class', [])):
-                        funding_text = div.get_text().strip()
-                        if funding_text and funding_text != project.get('title', ''):
-                            # 研究者情報を含まないように調整
-                            lines = funding_text.split('\n')
-                            funding_lines = []
-                            for line in lines:
-                                line = line.strip()
-                                if line and not any(keyword in line for keyword in ['兼松', '平井', '小川', '生貝', '田路', '小林', '岡田', '内海', '三浦', '加藤', '鈴木', '秋元', '岩田', '矢島', '中平', 'Colligon', '枡田', '小川', '亜希子', '玉内']):
-                                    funding_lines.append(line)
-                            if funding_lines:
-                                project['funding_system'] = ' '.join(funding_lines)
-                            break
-
-                # 研究者を抽出
-                author_div = item.find('div', class_='rm-cv-list-author')
-                if author_div:
-                    project['researchers'] = author_div.get_text().strip()
-
-                # 競争的資金かどうかを判定
-                project['is_competitive'] = self.is_competitive_funding_by_html_structure(
-                    project.get('funding_system', ''),
-                    project.get('institution', ''),
-                    project.get('project_type', '')
-                )
+            # 研究課題のli要素を読み込み順に処理し、処理済みの要素はすぐ解放する
+            # （課題数が多いページでもページ全体の木を保持しない）
+            for _, item in etree.iterparse(io.BytesIO(response.content), tag='li', html=True, encoding='utf-8'):
+                if ProjectListSelectors.ITEM_CLASS not in (item.get('class') or '').split():
+                    continue
 
+                project = self._extract_project_info(item)
                 if project.get('title'):  # タイトルがある場合のみ追加
                     projects.append(project)
 
+                item.clear(keep_tail=True)
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+
             return projects
 
         except Exception as e:
             logger.error(f"研究課題抽出エラー: {e}")
             return []
 
+    def _extract_project_info(self, item: etree._Element) -> Dict[str, Any]:
+        """研究課題一覧のli要素から1件分の課題情報を抽出"""
+        project = {}
+
+        # タイトルを抽出
+        title_link = ProjectListSelectors.TITLE(item)
+        if title_link:
+            project['title'] = ProjectListSelectors.text(title_link[0])
+            project['project_url'] = URLHelper.ensure_absolute_url(title_link[0].get('href'))
+
+        # 資金システムと期間を抽出
+        # リンクを含むdivは、各リンクの祖先をたどって1回でまとめて求める
+        # （divごとに配下のリンクを探し直さない）
+        divs_with_link = {div for link in item.iter('a') for div in link.iterancestors('div')}
+        title = project.get('title', '')
+
+        for div in item.iter('div'):
+            # タイトルリンクを含まないdivを探す
+            if div not in divs_with_link and ProjectListSelectors.AUTHOR_CLASS not in (div.get('class') or '').split():
+                # テキストは要素ごとに1回だけ取り出し、最初に見つかった資金情報で打ち切る
+                funding_text = ProjectListSelectors.text(div)
+                if funding_text and funding_text != title:
+                    # 研究者情報を含まないように調整
+                    funding_lines = [line for line in map(str.strip, funding_text.split('\n'))
+                                     if line and not ProjectListSelectors.AUTHOR_NAME_RE.search(line)]
+                    if funding_lines:
+                        project['funding_system'] = ' '.join(funding_lines)
+                    break
+
+        # 研究者を抽出
+        author_div = ProjectListSelectors.AUTHOR(item)
+        if author_div:
+            project['researchers'] = ProjectListSelectors.text(author_div[0])
+
+        # 競争的資金かどうかを判定
+        project['is_competitive'] = self.is_competitive_funding_by_html_structure(
+            project.get('funding_system', ''),
+            project.get('institution', ''),
+            project.get('project_type', '')
+        )
+
+        return project
+
     def _extract_competitive_projects(self, all_projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """競争的研究課題を抽出"""
         competitive_projects = []
@@ -750,7 +1015,7 @@ class ResearchMapIntegratedScraper:
             if response.status_code != 200:
                 return {}
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             details = {}
 
@@ -865,61 +1130,24 @@ class ResearchMapIntegratedScraper:
         """HTMLの構成要素に基づいて競争的資金かどうかを判定"""
         logger.info(f"競争的資金判定開始 - 機関: {institution}, 事業: {project_type}, システム: {funding_system}")
 
-        # 競争的資金と判定される機関名
-        competitive_institutions = [
-            '日本学術振興会',
-            'JST',
-            '国立研究開発法人科学技術振興機構',
-            '文部科学省',
-            '厚生労働省',
-            '経済産業省',
-            '国立研究開発法人新エネルギー・産業技術総合開発機構',
-            'NEDO',
-            '独立行政法人新エネルギー・産業技術総合開発機構'
-        ]
-
-        # 競争的資金と判定される事業タイプ
-        competitive_project_types = [
-            '科学研究費助成事業',
-            '科学研究費',
-            '科学研究費補助金',
-            '基盤研究',
-            '若手研究',
-            '萌芽研究',
-            '挑戦的研究',
-            '特別推進研究',
-            '新学術領域研究',
-            '特別研究員',
-            '挑戦的萌芽研究',
-            '地熱発電技術研究開発',
-            '新エネルギーベンチャー技術革新事業'
-        ]
-
         # 機関名による判定
-        if institution and institution in competitive_institutions:
+        if institution and institution in CompetitiveFundingPatterns.COMPETITIVE_INSTITUTION_SET:
             logger.info(f"  機関名による判定: True ({institution})")
             return True
 
         # 事業タイプによる判定
         if project_type:
-            for competitive_type in competitive_project_types:
-                if competitive_type in project_type:
-                    logger.info(f"  事業タイプによる判定: True ({competitive_type} in {project_type})")
-                    return True
+            match = CompetitiveFundingPatterns.COMPETITIVE_PROJECT_TYPE_RE.search(project_type)
+            if match:
+                logger.info(f"  事業タイプによる判定: True ({match.group()} in {project_type})")
+                return True
 
         # 資金システム情報による判定（フォールバック）
         if funding_system:
-            funding_lower = funding_system.lower()
-            competitive_indicators = [
-                '科研費', '科学研究費', '基盤研究', '若手研究', '萌芽研究',
-                '挑戦的研究', '特別推進研究', '新学術領域研究', '特別研究員',
-                '助成事業', '補助金', '挑戦的萌芽研究', '地熱発電技術研究開発',
-                '新エネルギーベンチャー技術革新事業'
-            ]
-            for indicator in competitive_indicators:
-                if indicator in funding_lower:
-                    logger.info(f"  助成金システムによる判定: True ({indicator} in {funding_system})")
-                    return True
+            match = CompetitiveFundingPatterns.COMPETITIVE_INDICATOR_RE.search(funding_system.lower())
+            if match:
+                logger.info(f"  助成金システムによる判定: True ({match.group()} in {funding_system})")
+                return True
 
         logger.info(f"  競争的資金ではないと判定")
         return False
@@ -930,7 +1158,7 @@ class ResearchMapIntegratedScraper:
             logger.info(f"研究キーワードを取得中: {researcher_url}")
 
             response = self._make_request(researcher_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             keywords = []
 
             # 研究キーワードセクションを取得
@@ -962,7 +1190,7 @@ class ResearchMapIntegratedScraper:
             logger.info(f"研究分野を取得中: {researcher_url}")
 
             response = self._make_request(researcher_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             areas = []
 
             # 研究分野セクションを取得
@@ -994,7 +1222,7 @@ class ResearchMapIntegratedScraper:
             logger.info(f"所属先を取得中: {researcher_url}")
 
             response = self._make_request(researcher_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             affiliations = []
 
             # 基本情報セクションから所属先を取得
@@ -1054,7 +1282,7 @@ class ResearchMapIntegratedScraper:
             logger.info(f"学歴を取得中: {researcher_url}")
 
             response = self._make_request(researcher_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             education = []
 
             # 学歴セクションを取得
@@ -1106,43 +1334,24 @@ class ResearchMapIntegratedScraper:
         researchers_with_projects = []
         total_competitive_projects = 0
 
-        for i, researcher in enumerate(all_researchers, 1):
-            try:
-                logger.info(f"研究者 {i}/{len(all_researchers)} を処理中: {researcher.get('name', 'Unknown')}")
+        def process(index_researcher):
+            i, researcher = index_researcher
+            logger.info(f"研究者 {i}/{len(all_researchers)} を処理中: {researcher.get('name', 'Unknown')}")
+            return self._scrape_researcher_with_projects(researcher)
 
-                researcher_url = researcher.get('researcher_url')
-                if not researcher_url:
-                    logger.warning(f"研究者 {researcher.get('name', 'Unknown')} のURLが見つかりません")
+        # 研究者ごとの取得はほぼ通信待ちなので、スレッドで並行して実行する（待機時間は各リクエスト後に入る）
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for researcher_data in executor.map(process, enumerate(all_researchers, 1)):
+                if researcher_data is None:
                     continue
 
-                # 詳細情報を取得
-                detailed_info = self.get_researcher_detailed_info(researcher_url)
-
-                # すべての研究課題を取得
-                all_projects = self._extract_all_projects(researcher_url)
-
-                # 競争的研究課題を抽出
-                competitive_projects = self._extract_competitive_projects(all_projects)
-                total_competitive_projects += len(competitive_projects)
-
-                researcher_data = researcher.copy()
-                researcher_data.update(detailed_info)
-                researcher_data['all_projects'] = all_projects
-                researcher_data['competitive_projects'] = competitive_projects
-                researcher_data['competitive_project_count'] = len(competitive_projects)
-
                 researchers_with_projects.append(researcher_data)
+                total_competitive_projects += researcher_data['competitive_project_count']
 
-                logger.info(f"研究者 {researcher.get('name', 'Unknown')}: "
-                          f"全{len(all_projects)}件、競争的{len(competitive_projects)}件 "
+                logger.info(f"研究者 {researcher_data.get('name', 'Unknown')}: "
+                          f"全{len(researcher_data['all_projects'])}件、競争的{researcher_data['competitive_project_count']}件 "
                           f"(累計: {total_competitive_projects}件)")
 
-                time.sleep(random.uniform(ScrapingConfig.REQUEST_DELAY_MIN, ScrapingConfig.REQUEST_DELAY_MAX))
-
-            except Exception as e:
-                logger.error(f"研究者 {researcher.get('name', 'Unknown')} の処理エラー: {e}")
-                continue
-
         result = {
             'total_researchers': len(all_researchers),
             'processed_researchers': len(researchers_with_projects),
@@ -1157,14 +1366,43 @@ class ResearchMapIntegratedScraper:
 
         return result
 
+    def _scrape_researcher_with_projects(self, researcher: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """研究者1人の詳細情報と研究課題を取得（失敗時はNone）"""
+        try:
+            researcher_url = researcher.get('researcher_url')
+            if not researcher_url:
+                logger.warning(f"研究者 {researcher.get('name', 'Unknown')} のURLが見つかりません")
+                return None
+
+            # 詳細情報を取得
+            detailed_info = self.get_researcher_detailed_info(researcher_url)
+
+            # すべての研究課題を取得
+            all_projects = self._extract_all_projects(researcher_url)
+
+            # 競争的研究課題を抽出
+            competitive_projects = self._extract_competitive_projects(all_projects)
+
+            researcher_data = researcher.copy()
+            researcher_data.update(detailed_info)
+            researcher_data['all_projects'] = all_projects
+            researcher_data['competitive_projects'] = competitive_projects
+            researcher_data['competitive_project_count'] = len(competitive_projects)
+
+            # 待機は_make_requestでリクエストごとに行うため、ここでは重ねて待たない
+            return researcher_data
+
+        except Exception as e:
+            logger.error(f"研究者 {researcher.get('name', 'Unknown')} の処理エラー: {e}")
+            return None
+
     def save_results(self, data: Dict[str, Any], output_file: str = None):
         """結果をJSONファイルに保存"""
         if not output_file:
             output_file = f"researchmap_integrated_results.json"
 
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            JSONHelper.dump(data, output_file)
             logger.info(f"結果を {output_file} に保存しました")
         except Exception as e:
             logger.error(f"ファイル保存エラー: {e}")
@@ -1175,8 +1413,13 @@ class ResearchMapIntegratedScraper:
             output_file = "researchmap_results.xlsx"
 
         try:
+            # 行の展開と集計を1回の走査で行う
             researchers_data = []
+            researchers_with_projects = 0
             for researcher in data['researchers']:
+                if researcher.get('competitive_project_count', 0) > 0:
+                    researchers_with_projects += 1
+
                 base_info = {
                     'name': researcher.get('name', ''),
                     'english_name': researcher.get('english_name', ''),
@@ -1219,38 +1462,70 @@ class ResearchMapIntegratedScraper:
 
                         researchers_data.append(row)
 
-            df = pd.DataFrame(researchers_data)
-
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='競争的研究課題', index=False)
-
-                summary_data = {
-                    '項目': [
-                        '総研究者数',
-                        '処理済み研究者数',
-                        '競争的研究課題総数',
-                        '競争的研究課題を持つ研究者数',
-                        '取得日時',
-                        '検索URL'
-                    ],
-                    '値': [
-                        data['total_researchers'],
-                        data['processed_researchers'],
-                        data['total_competitive_projects'],
-                        len([r for r in data['researchers'] if r.get('competitive_project_count', 0) > 0]),
-                        data['scraped_at'],
-                        data['search_url']
-                    ]
-                }
+            summary_data = {
+                '項目': [
+                    '総研究者数',
+                    '処理済み研究者数',
+                    '競争的研究課題総数',
+                    '競争的研究課題を持つ研究者数',
+                    '取得日時',
+                    '検索URL'
+                ],
+                '値': [
+                    data['total_researchers'],
+                    data['processed_researchers'],
+                    data['total_competitive_projects'],
+                    researchers_with_projects,
+                    data['scraped_at'],
+                    data['search_url']
+                ]
+            }
+
+            if XLSXWRITER_AVAILABLE:
+                self._write_excel_streaming(output_file, {
+                    '競争的研究課題': researchers_data,
+                    'サマリー': [dict(zip(summary_data, values)) for values in zip(*summary_data.values())]
+                })
+            else:
+                df = pd.DataFrame(researchers_data)
 
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='サマリー', index=False)
+                with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+                    df.to_excel(writer, sheet_name='競争的研究課題', index=False)
+
+                    summary_df = pd.DataFrame(summary_data)
+                    summary_df.to_excel(writer, sheet_name='サマリー', index=False)
 
             logger.info(f"結果を {output_file} にエクスポートしました")
 
         except Exception as e:
             logger.error(f"Excelエクスポートエラー: {e}")
 
+    @staticmethod
+    def _write_excel_streaming(output_file: str, sheets: Dict[str, List[Dict[str, Any]]]):
+        """xlsxwriterのconstant_memoryモードで各シートを行単位に書き出す
+
+        （pandasのto_excelは列単位でセルを書くためconstant_memoryと併用できない）
+        """
+        workbook = xlsxwriter.Workbook(output_file, {
+            'constant_memory': True,
+            # 文字列は数式・ハイパーリンクに変換せずそのまま書く（openpyxl出力と同じ）
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        try:
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+            for sheet_name, rows in sheets.items():
+                worksheet = workbook.add_worksheet(sheet_name)
+                # 列は各行のキーの出現順（DataFrameの列順と同じ）
+                columns = list(dict.fromkeys(key for row in rows for key in row))
+                if not columns:
+                    continue
+                worksheet.write_row(0, 0, columns, header_format)
+                for row_index, row in enumerate(rows, 1):
+                    worksheet.write_row(row_index, 0, [row.get(column) for column in columns])
+        finally:
+            workbook.close()
+
     def get_comprehensive_researcher_data(self, researcher_url: str) -> Dict[str, Any]:
         """一人の研究者について取得できるすべてのデータを取得"""
         comprehensive_data = self._initialize_comprehensive_data(researcher_url)
@@ -1307,7 +1582,7 @@ class ResearchMapIntegratedScraper:
 
         # 研究者ページから直接抽出
         response = self._make_request(researcher_url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
 
         keywords = self._extract_research_keywords(soup)
         areas = self._extract_research_areas(soup)
@@ -1326,7 +1601,7 @@ class ResearchMapIntegratedScraper:
 
         # 研究者ページから直接抽出
         response = self._make_request(researcher_url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
 
         affiliations = self._extract_affiliations(soup)
         logger.info(f"所属先取得完了: {len(affiliations)}件")
@@ -1413,29 +1688,32 @@ class ResearchMapIntegratedScraper:
 
         summary['total_projects'] = len(projects)
 
-        # 競争的研究課題の統計
-        competitive_projects = [p for p in projects if p.get('is_competitive', False)]
-
-        summary['competitive_projects'] = len(competitive_projects)
-
-        # 助成金機関の統計
-        institutions = {}
+        # 競争的研究課題・助成金機関・研究期間の統計を1回の走査で集計
+        competitive_count = 0
+        institutions = Counter()
+        periods = set()
         for project in projects:
-            institution = project.get('institution', 'Unknown')
-            if institution in institutions:
-                institutions[institution] += 1
-            else:
-                institutions[institution] = 1
+            if project.get('is_competitive', False):
+                competitive_count += 1
+            institutions[project.get('institution', 'Unknown')] += 1
+            if project.get('period'):
+                periods.add(project['period'])
+
+        summary['competitive_projects'] = competitive_count
 
-        summary['funding_institutions'] = institutions
+        summary['funding_institutions'] = dict(institutions)
         summary['unique_institutions_count'] = len(institutions)
 
-        # 研究期間の統計
-        periods = [p.get('period', 'Unknown') for p in projects if p.get('period')]
-        summary['research_periods'] = list(set(periods))
+        summary['research_periods'] = list(periods)
 
         return summary
 
+    def close(self):
+        """セッションとキャッシュを閉じる"""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
     def save_comprehensive_data(self, data: Dict[str, Any], researcher_id: str = None) -> str:
         """包括的データをJSONファイルに保存"""
         if not researcher_id:
@@ -1444,8 +1722,7 @@ class ResearchMapIntegratedScraper:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"comprehensive_researcher_data_{researcher_id}_{timestamp}.json"
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        JSONHelper.dump(data, filename)
 
         logger.info(f"包括的データを保存しました: {filename}")
         return filename
@@ -1516,6 +1793,8 @@ def main():
         logger.error(f"メイン処理エラー: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        scraper.close()
 
 if __name__ == "__main__":
     main()
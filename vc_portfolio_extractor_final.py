@@ -77,7 +77,7 @@ class VCPortfolioExtractor:
         if not html_content:
             return []
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         companies = []
 
         # Remove script and style elements
@@ -93,12 +93,15 @@ class VCPortfolioExtractor:
         ]
 
         # First, try to find portfolio-specific sections
+        # Walk the text nodes once with a combined pattern instead of once per pattern,
+        # then group the hits per pattern to keep the original section order
+        combined_pattern = re.compile('|'.join(portfolio_patterns), re.IGNORECASE)
+        matched_strings = soup.find_all(string=combined_pattern)
         portfolio_sections = []
         for pattern in portfolio_patterns:
-            # Use string parameter instead of deprecated text parameter
-            elements = soup.find_all(string=re.compile(pattern, re.IGNORECASE))
-            for element in elements:
-                if element.parent:
+            pattern_re = re.compile(pattern, re.IGNORECASE)
+            for element in matched_strings:
+                if element.parent and pattern_re.search(element):
                     portfolio_sections.append(element.parent)
 
         # Extract company names from portfolio sections
@@ -17,6 +17,11 @@ class VCPortfolioWithFunding:
         self.vc_list = []
         self.integrated_data = []
         self.final_output = []
+        # Reuse one connection pool and set the request headers once for all searches
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
 
     def normalize_vc_name(self, vc_name):
         """Normalize VC name for better matching"""
@@ -130,14 +135,10 @@ class VCPortfolioWithFunding:
             # Create search URL for Prtimes
             search_url = f"https://prtimes.jp/main/search.php?q={company_name}+調達"
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = self.session.get(search_url, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             # Extract funding articles (this is a simplified version)
             articles = []